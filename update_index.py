@@ -5,15 +5,24 @@ Parses CSV data with provider scores and generates an interactive HTML dashboard
 """
 
 import csv
+import filecmp
+import gzip
+import hashlib
+import io
 import json
+import math
+import os
 import re
 import shutil
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List, TextIO, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Criterion:
     """Represents a single evaluation criterion."""
 
@@ -21,18 +30,27 @@ class Criterion:
     weight: float
     name: str  # Short criterion name from CSV column 1
     description: str
-    scores: Dict[str, float] = field(default_factory=dict)
+    # One score per provider, indexed like PROVIDERS
+    scores: List[float] = field(default_factory=lambda: [0.0] * len(PROVIDERS))
 
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     """Represents a category of criteria (e.g., Copilot, ACW, etc.)."""
 
     name: str
     weight_percent: float
     criteria: List[Criterion] = field(default_factory=list)
-    subtotals: Dict[str, str] = field(default_factory=dict)  # Provider subtotals
+    # Provider subtotals, indexed like PROVIDERS
+    subtotals: List[str] = field(default_factory=lambda: ["0%"] * len(PROVIDERS))
+    # The same subtotals parsed to floats once, for sorting and bar widths
+    subtotal_values: List[float] = field(
+        default_factory=lambda: [0.0] * len(PROVIDERS)
+    )
+
 
+# Sink for HTML fragments, e.g. list.append or a file's write method.
+Writer = Callable[[str], object]
 
 PROVIDERS = [
     "Google Cloud CCAI",
@@ -79,6 +97,9 @@ CATEGORY_MAP = {
     "БІЗНЕС ТА ВПРОВАДЖЕННЯ": ("business", "Бізнес", 10),
 }
 
+# Position of each provider in PROVIDERS, i.e. in the per-provider score lists.
+_PROVIDER_IDX: Dict[str, int] = {p: i for i, p in enumerate(PROVIDERS)}
+
 # Short display labels for breakdown bars in provider score cards.
 # Derived from CATEGORY_MAP so the two sources stay in sync.
 _CATEGORY_BREAKDOWN_LABELS: Dict[str, str] = {
@@ -90,18 +111,110 @@ _CATEGORY_BREAKDOWN_LABELS: Dict[str, str] = {
     "business": "Бізнес",
 }
 
+# (cat_id, label, max_weight) per breakdown bar, in CATEGORY_MAP order.
+# Built once so provider cards don't repeat the lookups per card.
+_CATEGORY_LABELS = tuple(
+    (cat_id, _CATEGORY_BREAKDOWN_LABELS[cat_id], cat_max_weight)
+    for cat_id, _cat_name, cat_max_weight in CATEGORY_MAP.values()
+)
+
+# MSC priorities that mark a criterion row.
+_PRIORITIES = frozenset(("Must", "Should", "Could"))
+
+# (css_class, letter) per priority; anything unknown renders as "Could".
+_PRIORITY_BADGE: Dict[str, tuple] = {
+    "Must": ("must", "M"),
+    "Should": ("should", "S"),
+    "Could": ("could", "C"),
+}
+
+# Provider score columns in the CSV, in PROVIDERS order.
+_SCORE_COLS = slice(4, 4 + len(PROVIDERS))
+
+# Normalises "84,1%"-style cells to "84.1" in a single pass.
+_NUM_TRANS = str.maketrans({",": ".", "%": ""})
+
+# Criterion weights and scores are bare numbers: only the decimal comma is
+# normalised, so a stray "5%" there still reads as 0 rather than 5.
+_DECIMAL_TRANS = str.maketrans(",", ".")
+
+# TCO cells look like "150 - 200 000" (thousands of USD per year).
+_TCO_RE = re.compile(r"^\d+\s*-\s*\d+\s*000$")
+
+
+def _is_tco(cell: str) -> bool:
+    """Return True if a stripped cell holds a TCO range.
+
+    The cheap substring checks reject almost every cell before the regex runs.
+    """
+    return "-" in cell and cell.endswith("000") and _TCO_RE.match(cell) is not None
+
 
 def _parse_score_float(score_str: str) -> float:
-    """Convert a score string like '84.1%' or '84,1' to a float."""
+    """Convert a score string like '84.1%' or '84,1' to a float.
+
+    Blank cells are the common case in sparse score rows, so they return 0.0
+    without going through float() and its exception path.
+    """
+    if not score_str:
+        return 0.0
     try:
-        return float(str(score_str).replace("%", "").replace(",", "."))
+        return float(str(score_str).translate(_NUM_TRANS))
     except (ValueError, AttributeError):
         return 0.0
 
 
-def parse_csv(filepath: str, delimiter: str = ";") -> tuple:
+def _parse_decimal(cell: str) -> float:
+    """Convert a bare numeric cell like '3,5' to a float; anything else is 0.0."""
+    if not cell:
+        return 0.0
+    try:
+        return float(cell.translate(_DECIMAL_TRANS))
+    except ValueError:
+        return 0.0
+
+
+def _rank_providers(final_scores: Dict[str, str]) -> List[str]:
+    """Return PROVIDERS ordered by final score, highest first.
+
+    Each score string is parsed once up front rather than inside the sort key.
+    """
+    scored = [(_parse_score_float(final_scores.get(p, "0%")), p) for p in PROVIDERS]
+    scored.sort(key=itemgetter(0), reverse=True)
+    return [p for _, p in scored]
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 file bytes with universal newlines, like Path.read_text()."""
+    return io.StringIO(data.decode("utf-8"), newline=None).getvalue()
+
+
+def _iter_data_rows(text: str, delimiter: str) -> Iterator[List[str]]:
+    """Yield the CSV rows that follow the provider header row.
+
+    ``text`` is the whole decoded file, read in one bulk read instead of line
+    by line through a buffered text file. Rows are split by csv.reader in a
+    single streaming pass. Rows before the header are skipped as they are
+    read, and no row list is materialised.
+    """
+    # Splitting happens on decoded text, not raw b"\n" bytes: quoted
+    # descriptions span several lines.
+    reader = csv.reader(io.StringIO(text), delimiter=delimiter)
+    # Find the header row with providers (has empty column 1 for criterion name)
+    for row in reader:
+        if len(row) > 3 and row[0] == "MSC" and row[2] == "Weight %":
+            break
+    else:
+        raise ValueError("Could not find header row")
+    yield from reader
+
+
+def parse_csv(filepath: str, delimiter: str = ";", text: str | None = None) -> tuple:
     """Parse the CSV file and extract categories, criteria, and scores.
 
+    ``text`` is the decoded file content when the caller has already read it;
+    otherwise ``filepath`` is read here.
+
     CSV structure (after update):
     - Column 0: MSC (Must/Should/Could)
     - Column 1: Criterion Name (short name)
@@ -114,112 +227,95 @@ def parse_csv(filepath: str, delimiter: str = ";") -> tuple:
     tco_values: Dict[str, str] = {}
     current_category: Category | None = None
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        rows = list(csv.reader(f, delimiter=delimiter))
-
-    # Find the header row with providers (has empty column 1 for criterion name)
-    header_row_idx = next(
-        (
-            i
-            for i, row in enumerate(rows)
-            if len(row) > 3 and row[0] == "MSC" and row[2] == "Weight %"
-        ),
-        None,
-    )
-    if header_row_idx is None:
-        raise ValueError("Could not find header row")
+    if text is None:
+        text = Path(filepath).read_text(encoding="utf-8")
 
-    for row in rows[header_row_idx + 1 :]:
+    for row in _iter_data_rows(text, delimiter):
         if len(row) < 4:
             continue
 
-        mscw = row[0].strip()
+        # Interned so every criterion shares one "Must"/"Should"/"Could" object
+        mscw = sys.intern(row[0].strip())
         criterion_name = row[1].strip()
         weight_str = row[2].strip()
         description = row[3].strip() if len(row) > 3 else ""
 
-        # Category header row
-        if mscw in CATEGORY_MAP:
-            cat_id, cat_name, cat_weight = CATEGORY_MAP[mscw]
+        # Category headers are recognised by the MSC column alone. Every other
+        # row goes through one if/elif chain in the original precedence:
+        # final score, TCO, subtotal, then criterion. A row whose cells look
+        # like a final-score or TCO row is classified as such whatever its MSC
+        # label says.
+        cat_entry = CATEGORY_MAP.get(mscw)
+        if cat_entry is not None:
+            # Category header row
+            cat_id, cat_name, cat_weight = cat_entry
             current_category = Category(name=cat_name, weight_percent=cat_weight)
             categories[cat_id] = current_category
             continue
 
-        # Final score row
-        if weight_str == "100%" and "Загальна оцінка" in description:
-            for j, provider in enumerate(PROVIDERS):
-                if len(row) > j + 4:
-                    final_scores[provider] = row[j + 4].strip()
-            continue
+        cells = [cell.strip() for cell in row[_SCORE_COLS]]
+        is_final = weight_str == "100%" and "Загальна оцінка" in description
+        # Each cell is tested once; the flags are reused to pick TCO values
+        tco_flags = [] if is_final else list(map(_is_tco, cells))
 
-        # TCO row (values match pattern like "150 - 200 000")
-        if len(row) > 4:
-            tco_pattern = r"^\d+\s*-\s*\d+\s*000$"
-            if any(re.match(tco_pattern, str(cell).strip()) for cell in row[4:19]):
-                for j, provider in enumerate(PROVIDERS):
-                    if len(row) > j + 4:
-                        val = row[j + 4].strip()
-                        if val and re.match(tco_pattern, val):
-                            tco_values[provider] = val
-                continue
-
-        # Subtotal row (has % in weight column, no MSC)
-        if weight_str and "%" in weight_str and not mscw:
-            if current_category:
-                for j, provider in enumerate(PROVIDERS):
-                    if len(row) > j + 4:
-                        current_category.subtotals[provider] = row[j + 4].strip()
-            continue
+        if is_final:
+            # Final score row
+            final_scores.update(zip(PROVIDERS, cells))
 
-        # Criterion row
-        if mscw in ("Must", "Should", "Could") and current_category:
-            try:
-                weight = float(weight_str.replace(",", ".")) if weight_str else 0.0
-            except ValueError:
-                weight = 0.0
+        elif any(tco_flags):
+            # TCO row (values match pattern like "150 - 200 000")
+            for provider, val, is_tco in zip(PROVIDERS, cells, tco_flags):
+                if is_tco:
+                    tco_values[provider] = val
 
-            name = criterion_name if criterion_name else truncate_text(description, 40)
+        elif weight_str and "%" in weight_str and not mscw:
+            # Subtotal row (has % in weight column, no MSC)
+            if current_category:
+                current_category.subtotals[: len(cells)] = cells
+                current_category.subtotal_values[: len(cells)] = [
+                    _parse_score_float(c.split(" / ")[0]) for c in cells
+                ]
+
+        elif mscw in _PRIORITIES and current_category:
+            # Criterion row
+            weight = _parse_decimal(weight_str)
+
+            # Fall back to the description, truncated for display
+            name = criterion_name or (
+                description if len(description) <= 40 else description[:40] + "..."
+            )
             criterion = Criterion(
                 priority=mscw, weight=weight, name=name, description=description
             )
 
-            for j, provider in enumerate(PROVIDERS):
-                if len(row) > j + 4:
-                    score_str = row[j + 4].strip()
-                    try:
-                        criterion.scores[provider] = float(score_str.replace(",", "."))
-                    except (ValueError, AttributeError):
-                        criterion.scores[provider] = 0.0
+            # The slice truncates short rows; missing trailing scores stay 0.0.
+            # map() keeps the per-cell iteration in C; only the float
+            # conversion itself runs as Python code.
+            criterion.scores[: len(cells)] = map(_parse_decimal, cells)
 
             current_category.criteria.append(criterion)
 
     return categories, final_scores, tco_values
 
 
+# CSS class per whole score point, indexed by int(score) clamped to 0..6.
+_SCORE_CLASSES = ("s1", "s1", "s2", "s3", "s4", "s5", "s5")
+
+
 def get_score_class(score: float) -> str:
-    """Get CSS class based on score value."""
-    if score >= 5:
-        return "s5"
-    elif score >= 4:
-        return "s4"
-    elif score >= 3:
-        return "s3"
-    elif score >= 2:
-        return "s2"
-    return "s1"
+    """Get CSS class based on score value (>=5 s5, >=4 s4, ... else s1).
+
+    The clamp runs on the float so that a stray "inf" cell reads as s5 instead
+    of overflowing int(); NaN compares false everywhere and falls to s1.
+    """
+    if math.isnan(score):
+        return "s1"
+    return _SCORE_CLASSES[int(min(max(score, 0.0), 6.0))]
 
 
 def get_priority_badge(priority: str) -> tuple:
     """Return (css_class, letter) for a priority string."""
-    return {
-        "Must": ("must", "M"),
-        "Should": ("should", "S"),
-    }.get(priority, ("could", "C"))
-
-
-def truncate_text(text: str, max_len: int = 50) -> str:
-    """Truncate text for display."""
-    return text[:max_len] + "..." if len(text) > max_len else text
+    return _PRIORITY_BADGE.get(priority, ("could", "C"))
 
 
 # ---------------------------------------------------------------------------
@@ -285,39 +381,58 @@ def _render_strategy_card(
                 </div>"""
 
 
+# (badge text, extra card classes) for the podium ranks.
+_RANK_BADGES = {
+    1: ("🥇 #1", " top top-1"),
+    2: ("🥈 #2", " top top-2"),
+    3: ("🥉 #3", " top top-3"),
+}
+
+
+# (max_weight, template) per breakdown bar, aligned with _CATEGORY_LABELS. The
+# label and cat_id are the same on every card, so they are baked in once and
+# only the bar width and the subtotal text are formatted per card.
+_BREAKDOWN_TMPLS = tuple(
+    (
+        cat_max_weight,
+        f'                            <div class="breakdown-item">\n'
+        f'                                <span class="breakdown-label">{label}</span>\n'
+        f'                                <div class="breakdown-bar">'
+        f'<div class="breakdown-fill {cat_id}" style="width: {{:.1f}}%;"></div></div>\n'
+        f'                                <span class="breakdown-value">{{}}</span>\n'
+        f"                            </div>",
+    )
+    for cat_id, label, cat_max_weight in _CATEGORY_LABELS
+)
+
+
 def generate_provider_card(
     provider: str,
     rank: int,
     score: str,
     tco: str,
-    category_scores: Dict[str, str],
-    max_weights: Dict[str, float],
+    category_scores: List[Tuple[str, float]],
 ) -> str:
-    """Generate HTML for a provider score card."""
-    RANK_BADGES = {1: "🥇 #1", 2: "🥈 #2", 3: "🥉 #3"}
-    RANK_CLASSES = {1: " top top-1", 2: " top top-2", 3: " top top-3"}
+    """Generate HTML for a provider score card.
 
-    rank_badge = RANK_BADGES.get(rank, f"#{rank}")
-    extra_classes = RANK_CLASSES.get(rank, "")
+    ``category_scores`` holds the (subtotal text, parsed value) pair for each
+    _CATEGORY_LABELS entry, in the same order.
+    """
+    rank_badge, extra_classes = _RANK_BADGES.get(rank, (f"#{rank}", ""))
     rank_style = ' style="opacity: 0.5;"' if rank > 3 else ""
 
-    # Build breakdown bars using CATEGORY_MAP as the single source of truth
-    # for cat_id ordering and max_weight; _CATEGORY_BREAKDOWN_LABELS for display names.
-    breakdowns = []
-    for csv_key, (cat_id, _cat_name, cat_max_weight) in CATEGORY_MAP.items():
-        label = _CATEGORY_BREAKDOWN_LABELS[cat_id]
-        cat_score = category_scores.get(cat_id, "0%")
-        score_part = cat_score.split(" / ")[0]
-        score_val = _parse_score_float(score_part)
-        fill_pct = (score_val / cat_max_weight * 100) if cat_max_weight > 0 else 0.0
-        breakdowns.append(
-            f'                            <div class="breakdown-item">\n'
-            f'                                <span class="breakdown-label">{label}</span>\n'
-            f'                                <div class="breakdown-bar">'
-            f'<div class="breakdown-fill {cat_id}" style="width: {fill_pct:.1f}%;"></div></div>\n'
-            f'                                <span class="breakdown-value">{cat_score}</span>\n'
-            f"                            </div>"
-        )
+    # Breakdown bars from the prebuilt _BREAKDOWN_TMPLS (CATEGORY_MAP order)
+    breakdowns = "\n".join(
+        [
+            tmpl.format(
+                (score_val / cat_max_weight * 100) if cat_max_weight > 0 else 0.0,
+                cat_score,
+            )
+            for (cat_max_weight, tmpl), (cat_score, score_val) in zip(
+                _BREAKDOWN_TMPLS, category_scores
+            )
+        ]
+    )
 
     score_display = score.replace("%", "")
 
@@ -328,484 +443,163 @@ def generate_provider_card(
                         <div class="score-value">{score_display}<span style="font-size: 24px;">%</span></div>
                         <div class="score-label">Підсумковий бал</div>
                         <div class="breakdown">
-{chr(10).join(breakdowns)}
+{breakdowns}
                         </div>
                     </div>'''
 
 
-def generate_criteria_row(criterion: Criterion, providers: List[str]) -> str:
-    """Generate HTML for a criteria row."""
+_SCORE_CELL_TMPL = (
+    '                        <div class="score-cell">'
+    '<div class="score {}">{}</div></div>'
+)
+
+
+def _format_number(value: float) -> str:
+    """Format a score or weight like str(), minus the trailing '.0' of whole numbers.
+
+    str() keeps every significant digit, unlike the 'g' format spec, which
+    rounds to six.
+    """
+    return str(int(value)) if value.is_integer() else str(value)
+
+
+@lru_cache(maxsize=None)
+def _render_score_cell(score: float) -> str:
+    """Render one score cell.
+
+    The score matrix only holds a handful of distinct values (1, 2, 3.5, ...),
+    so each cell is classified and formatted once and then served from cache.
+    """
+    return _SCORE_CELL_TMPL.format(get_score_class(score), _format_number(score))
+
+
+# Makes a CSV description safe for the details panel in a single pass.
+_DESC_TRANS = str.maketrans({'"': "'", "\n": "<br>"})
+
+
+def generate_criteria_row(
+    write: Writer, criterion: Criterion, columns: List[int]
+) -> None:
+    """Write the HTML for a criteria row.
+
+    ``columns`` lists the PROVIDERS indices to show, in display order.
+    """
     priority_class, _ = get_priority_badge(criterion.priority)
-    w = criterion.weight
-    weight_label = f"{int(w)}%" if w == int(w) else f"{w}%"
-    desc_full = criterion.description.replace('"', "'").replace("\n", "<br>")
-
-    score_cells = []
-    for provider in providers:
-        score = criterion.scores.get(provider, 0)
-        score_class = get_score_class(score)
-        score_display = str(int(score)) if score == int(score) else str(score)
-        score_cells.append(
-            f'                        <div class="score-cell">'
-            f'<div class="score {score_class}">{score_display}</div></div>'
-        )
+    weight_label = f"{_format_number(criterion.weight)}%"
+    desc_full = criterion.description.translate(_DESC_TRANS)
+
+    scores = criterion.scores
+    score_cells = "\n".join(_render_score_cell(scores[i]) for i in columns)
 
-    n = len(providers)
-    return f"""                    <div class="criteria-row" onclick="toggleExpand(this)" style="grid-template-columns: 200px repeat({n}, 1fr);">
+    n = len(columns)
+    write(f"""                    <div class="criteria-row" onclick="toggleExpand(this)" style="grid-template-columns: 200px repeat({n}, minmax(0, 1fr));">
                         <div class="criteria-name">
                             <span class="priority-badge {priority_class}">{weight_label}</span>
                             {criterion.name}
                         </div>
-{chr(10).join(score_cells)}
+{score_cells}
                         <div class="expand-details">
                             <h4>Деталі оцінки</h4>
                             <p>{desc_full}</p>
                         </div>
-                    </div>"""
+                    </div>""")
 
 
-def generate_category_tab(cat_id: str, category: Category, providers: List[str]) -> str:
-    """Generate HTML for a category tab content."""
-    rows = "\n".join(generate_criteria_row(c, providers) for c in category.criteria)
+def _render_header_cols(providers: List[str]) -> str:
+    """Render the provider column headers shared by every category table."""
+    return "\n".join(
+        f'                        <div class="provider-column">{PROVIDER_DISPLAY_NAMES.get(p, p)}</div>'
+        for p in providers
+    )
 
-    providers_sorted_by_cat = sorted(
-        providers,
-        key=lambda p: _parse_score_float(category.subtotals.get(p, "0")),
-        reverse=True,
+
+def generate_category_tab(
+    write: Writer,
+    cat_id: str,
+    category: Category,
+    providers: List[str],
+    header_cols: str,
+) -> None:
+    """Write the HTML for a category tab content.
+
+    ``header_cols`` is the prerendered output of _render_header_cols(providers).
+    """
+    columns = [_PROVIDER_IDX[p] for p in providers]
+    subtotals = category.subtotals
+    columns_sorted_by_cat = sorted(
+        columns, key=category.subtotal_values.__getitem__, reverse=True
     )
     summary_cards = "\n".join(
         f'                    <div class="summary-card">\n'
-        f"                        <h5>{p}</h5>\n"
-        f'                        <div class="value">{category.subtotals.get(p, "0%")}</div>\n'
+        f"                        <h5>{PROVIDERS[i]}</h5>\n"
+        f'                        <div class="value">{subtotals[i]}</div>\n'
         f"                    </div>"
-        for p in providers_sorted_by_cat
-    )
-
-    header_cols = "\n".join(
-        f'                        <div class="provider-column">{PROVIDER_DISPLAY_NAMES.get(p, p)}</div>'
-        for p in providers
+        for i in columns_sorted_by_cat
     )
 
-    return f'''        <div class="tab-content" data-content="{cat_id}">
+    write(f'''        <div class="tab-content" data-content="{cat_id}">
             <div class="summary-section">
                 <h3 class="summary-title">{category.name} ({category.weight_percent}%) - Оцінка провайдерів</h3>
                 <div class="comparison-table">
-                    <div class="table-header" style="grid-template-columns: 200px repeat({len(providers)}, 1fr);">
+                    <div class="table-header" style="grid-template-columns: 200px repeat({len(providers)}, minmax(0, 1fr));">
                         <div>Критерій</div>
 {header_cols}
                     </div>
 
-{rows}
+''')
+    for i, criterion in enumerate(category.criteria):
+        if i:
+            write("\n")
+        generate_criteria_row(write, criterion, columns)
+    write(f'''
 
                 </div>
                 <div class="summary-grid">
 {summary_cards}
                 </div>
             </div>
-        </div>'''
+        </div>''')
 
 
-def generate_recommendations_tab(final_scores: Dict[str, str]) -> str:
-    """Generate HTML for the recommendations tab."""
+# Static parts of the recommendations tab; only the provider grid between them
+# depends on the CSV.
+_RECOMMENDATIONS_HEAD_HTML = """        <div class="tab-content" data-content="recommendations">
+            <div class="recommendations-section">
+                <div class="rec-header">
+                    <div class="rec-eyebrow">Фінальний розділ</div>
+                    <h3 class="rec-title">Ключові висновки аналізу</h3>
+                    <p class="rec-lead">
+                        Порівняльна оцінка 15 провайдерів за методологією MSC. Вага критеріїв відповідає
+                        пріоритетам контакт-центру на 1 000 операторів з високорозвиненою екосистемою —
+                        готовим робочим місцем оператора, деревом тематик, функціонуючою базою знань
+                        та власною системою аналітики.
+                    </p>
+                </div>
 
-    def _score(provider: str) -> str:
-        raw = final_scores.get(provider, "—")
-        return raw if raw.endswith("%") else (raw + "%" if raw != "—" else raw)
+                <div class="rec-divider">
+                    <span class="rec-divider-label">Аналіз Провайдерів</span>
+                    <div class="rec-divider-line"></div>
+                </div>
 
-    # ------------------------------------------------------------------
-    # Priority provider cards (full-width)
-    # ------------------------------------------------------------------
-    cresta_card = _render_strategy_card(
-        border_rgba="rgba(34,211,238,.3)",
-        label_color="#22d3ee",
-        label_text="Real-Time Assist · Agent Copilot · #1 Score",
-        score_text=_score("Cresta"),
-        title="Cresta AI",
-        subtitle="Real-Time Assist · Agent Copilot · Ocean-1",
-        indent="                    ",
-        pros=[
-            "Ocean-1: власна модель від ех-співробітників OpenAI з мультимовною підтримкою",
-            "Найкращий Copilot на ринку, глибока постобробка, нативна інтеграція у робоче місце оператора, висока точність аналітики",
-            "Cresta має українське венчурне коріння від фонду Roosh Ventures Сергія Токарєва (раунд $80 млн у 2022)",
-            "Email-підтримка як повноцінний канал комунікації",
-        ],
-        cons=[
-            "Потребує тестування діалогів та суржику — авторезюме, заповнення тематик, полів та маркування розмов",
-            "Відсутність нативної інтеграції з Binotel, Power Platform, Power BI",
-            "Тривале налаштування та непрозора вартість розробки",
-        ],
-    )
+"""
 
-    google_card = _render_strategy_card(
-        border_rgba="rgba(245,200,66,.3)",
-        label_color="#f5c842",
-        label_text="Enterprise-рішення · #2 Score",
-        score_text=_score("Google Cloud CCAI"),
-        title="Google Cloud CCAI",
-        subtitle="Contact Center AI · Agent Assist · Dialogflow CX · Gemini",
-        indent="                    ",
-        pros=[
-            "Нативна підтримка української мови з кращим авторезюме. Підтримка 100+ мов через Google NLU",
-            "Спеціалізована telephony-модель, навчена на аудіо телефонних ліній та IVR-систем",
-            "Gemini — один з найпотужніших LLM у світі",
-            "Нативна інтеграція з Cisco",
-            "Повний стек із набору інструментів. Гнучка компонентна архітектура (оплата лише за необхідний функціонал)",
-        ],
-        cons=[
-            "Потребує тестування діалогів та суржику — авторезюме, заповнення тематик, полів та маркування розмов",
-            "Відсутність нативної інтеграції з Binotel, Power Platform, Power BI",
-            "Складність адміністрування та дорога вартість розробки",
-            "Складність налаштування повного стеку",
-        ],
-    )
+_RECOMMENDATIONS_TAIL_HTML = """
 
-    ender_card = _render_strategy_card(
-        border_rgba="rgba(62,207,142,.25)",
-        label_color="#10b981",
-        label_text="Співвідношення ціна / якість",
-        score_text=_score("Ender Turing"),
-        title="Ender Turing",
-        subtitle="Локальний продукт із найкращим розумінням українського говору",
-        indent="                    ",
-        pros=[
-            "Найкраща генерація резюме розмов",
-            "Модулі аналітики та якісне навчання операторів",
-            "Підтверджений досвід у NovaPay",
-            "100% автоматизований контроль якості. Аналітика рівня світових продуктів",
-        ],
-        cons=[
-            "Відсутній інструмент підказок у реальному часі — не є асистентом оператора під час дзвінка",
-            "Немає функцій Pre-Call AI (голосовий бот / заміна IVR)",
-            "Слабші інтеграційні можливості — потрібна розробка API з усіма системами",
-            "Алгоритми ACW поступаються якістю великим мовним моделям (GPT, Gemini)",
-        ],
-    )
+                <div class="rec-divider">
+                    <span class="rec-divider-label">Ключові висновки</span>
+                    <div class="rec-divider-line"></div>
+                </div>
 
-    unitalk_card = _render_strategy_card(
-        border_rgba="rgba(156,163,175,.25)",
-        label_color="var(--muted)",
-        label_text="Call Recording · Voice Bot",
-        score_text=_score("Uni Talk"),
-        title="Uni Talk",
-        subtitle="Локальний продукт · Голосовий бот",
-        indent="                    ",
-        pros=[
-            "Український продукт із функціоналом голосового бота",
-            "Швидкий і безкоштовний пілот",
-            "Інтуїтивне адміністрування та зручний інтерфейс для менеджерів",
-            "Швидкий онбординг після підписання контракту",
-        ],
-        cons=[
-            "Відсутній функціонал копайлота",
-            "Максимум 15 API-запитів на секунду",
-            "Немає авторезюме дзвінка, лише транскрибація і таймлайни",
-            "Відсутня автоматична оцінка якості та аналітика",
-            "Слабке тегування та маркування розмов",
-            "Моноліт. Рішення передбачає свою телефонію",
-        ],
-    )
+                <div class="strategy-alert-card" style="border-color: rgba(255,255,255,0.15);">
 
-    # ------------------------------------------------------------------
-    # Secondary provider cards (2-column grid rows)
-    # ------------------------------------------------------------------
-    microsoft_card = _render_strategy_card(
-        border_rgba="rgba(74,158,255,.25)",
-        label_color="var(--accent-text)",
-        label_text="AI Ecosystem · Azure OpenAI",
-        score_text=_score("Microsoft Copilot"),
-        title="Microsoft Copilot",
-        subtitle="Dynamics 365 · Power Platform",
-        indent="                    ",
-        pros=[
-            "Висока швидкість і точність Next Best Action для вирішення запитів",
-            "Найкращий пошук із завантаженою базою знань із наданням прямих посилань на документи",
-            "Гнучка адаптація відповідей під контекст розмови",
-            "Безшовна передача даних аналітики у внутрішні системи звітності",
-            "Найвищий рівень маскування чутливих даних клієнтів",
-        ],
-        cons=[
-            "Слабше автоматичне перенесення даних саме з україномовних розмов",
-            "Фокус інструментарію платформи зроблено на текстові канали зв'язку",
-            "Висока вартість ліцензій та складність налаштування",
-            "Обмежена автоматизація процесу у кейсах: з 7 до 4хв",
-        ],
-    )
+                        <div class="strategy-title">Ризики монолітних CCaaS платформ</div>
+                        <div class="strategy-text">
+                            Глобальні рішення формату «все-в-одному» (Genesys Cloud CX або NICE CXone), попри свою потужність,
+                            вимагають міграції операторів у власні інтерфейси та використання вбудованих баз знань.
+                            Для нас це означатиме <strong style="color:#f59e0b;">міграцію до вендора та відмову від власних робочих місць операторів.</strong>
+                        </div>
 
-    nice_card = _render_strategy_card(
-        border_rgba="rgba(168,85,247,.25)",
-        label_color="#a855f7",
-        label_text="Enterprise Cloud Contact Center",
-        score_text=_score("NICE"),
-        title="NICE",
-        subtitle="Enlighten AI · Autopilot",
-        indent="                    ",
-        pros=[
-            "Швидкість аналізу контексту у реальному часі займає до 2 секунд",
-            "Copilot-функціонал для супроводу оператора (підказки, генерація скриптів)",
-            "Наявність професійного вбудованого модуля WFM",
-            "Розвинені інструменти автоматичного навчання операторів",
-        ],
-        cons=[
-            "Глобальна міграція — повноцінна інфраструктурна платформа",
-            "Необхідність тестування української мови для авторезюме (ACW)",
-            "Слабше розпізнавання суржику порівняно з локальними продуктами",
-            "Довгий та складний процес впровадження",
-        ],
-    )
-
-    genesys_card = _render_strategy_card(
-        border_rgba="rgba(251,146,60,.25)",
-        label_color="#fb923c",
-        label_text="Contact Center as a Service",
-        score_text=_score("Genesys Cloud CX"),
-        title="Genesys Cloud CX",
-        subtitle="Genesys AI · Agent Assist",
-        indent="                    ",
-        pros=[
-            "Надійний модуль Agent Assist із високою швидкістю підказок",
-            "Відмінне автоматичне маскування чутливої інформації",
-            "Зручне low-code налаштування без залучення ІТ",
-            "Високий рівень масштабування та витривалість",
-        ],
-        cons=[
-            "Глобальна міграція — повноцінна платформа, що потребує переїзду",
-            "Низька точність STT для українського аудіо",
-            "Потенційні складнощі з визначенням глибоких підтематик",
-            "Відсутні інструменти для ШІ-перевірки по чек-листу",
-        ],
-    )
-
-    cognigy_card = _render_strategy_card(
-        border_rgba="rgba(168,85,247,.25)",
-        label_color="#a855f7",
-        label_text="Conversational AI · Bot-first",
-        score_text=_score("NICE Cognigy"),
-        title="NICE Cognigy",
-        subtitle="Omnichannel",
-        indent="                    ",
-        pros=[
-            "Потужний Pre-Call AI — лідер у створенні голосових ботів",
-            "Зручні візуальні конструктори low-code",
-            "Висока швидкість NBA та відмінний пошук по документації",
-        ],
-        cons=[
-            "Немає підтверджень генерації українською авторезюме",
-            "Складнощі зі швидкістю маркування та фільтрації даних",
-            "Гірші можливості для передачі даних у кастомне робоче місце",
-        ],
-    )
-
-    liveperson_card = _render_strategy_card(
-        border_rgba="rgba(156,163,175,.25)",
-        label_color="var(--muted)",
-        label_text="Text-first · AI Chatbots",
-        score_text=_score("Live Person"),
-        title="Live Person",
-        subtitle="Conversational Cloud",
-        indent="                    ",
-        pros=[
-            "Сильний інструментарій для чатів, месенджерів та NBA у тексті",
-            "Високий рівень захисту та автоматичного маскування даних",
-        ],
-        cons=[
-            "Відсутнє підтвердження якісного розуміння українського голосу та суржику",
-            "Контроль якості дзвінків відсутній по чек-листах",
-            "Значне відставання у функціоналі ACW",
-        ],
-    )
-
-    ringostat_card = _render_strategy_card(
-        border_rgba="rgba(156,163,175,.25)",
-        label_color="var(--muted)",
-        label_text="Call Tracking · Cloud PBX",
-        score_text=_score("Ringostat"),
-        title="Ringostat",
-        subtitle="AI Analytics",
-        indent="                    ",
-        pros=[
-            "Швидкий та безкоштовний запуск тестового періоду",
-            "Відмінний базовий рівень розпізнавання української мови та суржику",
-            "Зрозумілі дашборди та висока здатність перетравлювати великі потоки даних",
-        ],
-        cons=[
-            "Фокус продукту на продажі, маркетинг та аналіз реклами",
-            "Відсутність Copilot-функцій",
-            "Слабкі можливості ACW та класифікації тематик",
-            "Відсутня архітектура для глибокої взаємодії з API",
-        ],
-    )
-
-    decagon_card = _render_strategy_card(
-        border_rgba="rgba(156,163,175,.25)",
-        label_color="var(--muted)",
-        label_text="Generative AI · Text-first",
-        score_text=_score("Decagon"),
-        title="Decagon",
-        subtitle="Customer Support Automation",
-        indent="                    ",
-        pros=[
-            "Сильні інструменти для текстових скриптів та пошуку по документації",
-            "Інтерфейс налаштувань інтуїтивно зрозумілий",
-            "Швидкий старт пілотного проєкту на реальних даних",
-            "Розгортають співпрацю із 11labs",
-        ],
-        cons=[
-            "Відсутність української голосової моделі для транскрибації",
-            "Слабкі модулі аналітики та автоматичного контролю якості (QA)",
-        ],
-    )
-
-    polyai_card = _render_strategy_card(
-        border_rgba="rgba(156,163,175,.25)",
-        label_color="var(--muted)",
-        label_text="Voice Assistants · Conversational IVR",
-        score_text=_score("Poly AI"),
-        title="Poly AI",
-        subtitle="Voice Assistants",
-        indent="                    ",
-        pros=[
-            "Вузька спеціалізація у голосових асистентах (Pre-Call, заміна IVR)",
-            "Здатність витримувати величезну кількість одночасних розмов",
-            "Надійні протоколи захисту даних",
-        ],
-        cons=[
-            "Менша швидкість обробки ШІ та глибина розуміння української",
-            "Відсутні підказки та супровід живого оператора",
-            "Немає інструментів для постобробки та аналітики",
-        ],
-    )
-
-    getvocal_card = _render_strategy_card(
-        border_rgba="rgba(156,163,175,.25)",
-        label_color="var(--muted)",
-        label_text="Local Voice · AI Provider",
-        score_text=_score("Get Vocal"),
-        title="Get Vocal",
-        subtitle="Local Voice AI",
-        indent="                    ",
-        pros=[
-            "Швидкий старт, готовність до локальної співпраці та недорогий тест",
-            "Готовий функціонал безшовної ескалації розмови з бота на оператора",
-        ],
-        cons=[
-            "Функціональне відставання швидкості роботи ШІ та поверхневе розуміння української",
-            "Відсутність функціоналу пошуку Copilot, модуля ACW та аналітики",
-            "Слабке розпізнавання суржику та недостатній аналіз емоцій",
-            "Не вказано у документації функціонал українською та аналіз емоцій",
-        ],
-    )
-
-    elevenlabs_card = _render_strategy_card(
-        border_rgba="rgba(156,163,175,.25)",
-        label_color="var(--accent-text)",
-        label_text="Голосовий асистент · STT-шар",
-        score_text=_score("11 Labs"),
-        title="ElevenLabs",
-        subtitle="Speech-to-Text · Scribe v2 · Streaming · Pre-Call",
-        indent="                    ",
-        pros=[
-            "Голосовий асистент та маршрутизація (Pre-Call)",
-            "STT — висока точність розпізнавання мови",
-            "Scribe v2 забезпечує розпізнавання суржику",
-            "Стрімінгова передача тексту із затримкою ~500 мс",
-            "Нативна Cisco-інтеграція",
-            "Сертифікації безпеки",
-        ],
-        cons=[
-            "Не є Copilot-рішенням — лише надає транскрибацію у систему",
-            "Відсутній функціонал ACW, аналітики та не може замінити IVR",
-        ],
-    )
-
-    verint_card = _render_strategy_card(
-        border_rgba="rgba(59,130,246,.25)",
-        label_color="#3b82f6",
-        label_text="Enterprise WEM · Da Vinci AI",
-        score_text=_score("Verint"),
-        title="Verint",
-        subtitle="CX Automation Platform · Da Vinci AI · WFM Leader",
-        indent="                    ",
-        pros=[
-            "Функціонал українською підтверджена документацією (Verint Speech Transcription, on-prem, LVCSR)",
-            "Зафіксований продукт представництва NovaIT",
-        ],
-        cons=[
-            "Sentiment, Topics, Auto Language Detection — тільки через Communications Analytics, підтримка української не підтверджена",
-            "Транскрипція українською доступна лише on-premise (Verint Speech Transcription), не в хмарі",
-            "Відсутність успішних кейсів в Україні",
-            "Очікувана вартість $200-350K/рік",
-            "Немає підтримки мов країн присутності",
-        ],
-    )
-
-    # Sort all recommendation cards by score descending, 3 per row
-    _all_rec_cards = [
-        (cresta_card, _score("Cresta")),
-        (google_card, _score("Google Cloud CCAI")),
-        (ender_card, _score("Ender Turing")),
-        (unitalk_card, _score("Uni Talk")),
-        (microsoft_card, _score("Microsoft Copilot")),
-        (nice_card, _score("NICE")),
-        (genesys_card, _score("Genesys Cloud CX")),
-        (cognigy_card, _score("NICE Cognigy")),
-        (liveperson_card, _score("Live Person")),
-        (ringostat_card, _score("Ringostat")),
-        (decagon_card, _score("Decagon")),
-        (polyai_card, _score("Poly AI")),
-        (elevenlabs_card, _score("11 Labs")),
-        (getvocal_card, _score("Get Vocal")),
-        (verint_card, _score("Verint")),
-    ]
-    _all_rec_cards.sort(
-        key=lambda x: float(x[1].replace("%", "").replace(",", ".") or "0"),
-        reverse=True,
-    )
-    _rec_rows = []
-    for i in range(0, len(_all_rec_cards), 3):
-        _chunk = [c[0] for c in _all_rec_cards[i : i + 3]]
-        _mb = "20px" if i + 3 >= len(_all_rec_cards) else "16px"
-        _rec_rows.append(
-            f'                <div style="display:grid;grid-template-columns:repeat({len(_chunk)},1fr);gap:16px;margin-bottom:{_mb};">\n'
-            + "\n".join(_chunk)
-            + "\n                </div>"
-        )
-    rec_provider_grid = "\n\n".join(_rec_rows)
-
-    return f"""        <div class="tab-content" data-content="recommendations">
-            <div class="recommendations-section">
-                <div class="rec-header">
-                    <div class="rec-eyebrow">Фінальний розділ</div>
-                    <h3 class="rec-title">Ключові висновки аналізу</h3>
-                    <p class="rec-lead">
-                        Порівняльна оцінка 15 провайдерів за методологією MSC. Вага критеріїв відповідає
-                        пріоритетам контакт-центру на 1 000 операторів з високорозвиненою екосистемою —
-                        готовим робочим місцем оператора, деревом тематик, функціонуючою базою знань
-                        та власною системою аналітики.
-                    </p>
-                </div>
-
-                <div class="rec-divider">
-                    <span class="rec-divider-label">Аналіз Провайдерів</span>
-                    <div class="rec-divider-line"></div>
-                </div>
-
-{rec_provider_grid}
-
-                <div class="rec-divider">
-                    <span class="rec-divider-label">Ключові висновки</span>
-                    <div class="rec-divider-line"></div>
-                </div>
-
-                <div class="strategy-alert-card" style="border-color: rgba(255,255,255,0.15);">
-
-                        <div class="strategy-title">Ризики монолітних CCaaS платформ</div>
-                        <div class="strategy-text">
-                            Глобальні рішення формату «все-в-одному» (Genesys Cloud CX або NICE CXone), попри свою потужність,
-                            вимагають міграції операторів у власні інтерфейси та використання вбудованих баз знань.
-                            Для нас це означатиме <strong style="color:#f59e0b;">міграцію до вендора та відмову від власних робочих місць операторів.</strong>
-                        </div>
-
-                </div>
+                </div>
 
                 <div class="strategy-card" style="border-color: rgba(255,255,255,0.15);">
                     <div class="strategy-label" style="color: var(--muted);">Важливий висновок</div>
@@ -1242,7 +1036,7 @@ AI API (синхронний)
 │ Structured JSON
 ▼
 CRM Connector (Cloud Function / мікросервіс)
-- POST /api/v1/calls/{{call_id}}/acw → РМ КЦ
+- POST /api/v1/calls/{call_id}/acw → РМ КЦ
 - Час: ~1–2с
 │ ← &lt; 15с після завершення
 ▼
@@ -1421,106 +1215,473 @@ BigQuery (suggestions_log: shown / accepted / rejected)</pre>
                     <div style="background:var(--card);border:1px solid var(--border2);border-radius:6px;padding:12px 16px;font-size:11.5px;color:var(--sub);line-height:1.7;"><b style="color:var(--text);">Коли обирати:</b> якщо підказки — це переважно "знайди правильну статтю / питання-відповідь" і швидкість — рекомендовано Google Agent Assist, після тестування якісного виявлення ключових сутностей.</div>
                   </div>
 
-                  <!-- ─── SECTION 5: PRE-CALL AI ─── -->
-                  <div style="background:var(--card);border:1px solid var(--border2);border-radius:12px;padding:24px;margin-bottom:24px;">
-                    <div style="display:flex;align-items:center;gap:12px;margin-bottom:14px;">
-                      <div style="width:30px;height:30px;border-radius:50%;background:#0d4372;display:flex;align-items:center;justify-content:center;color:#fff;font-weight:700;font-size:13px;flex-shrink:0;">5</div>
-                      <div>
-                        <div style="font-size:15px;font-weight:700;color:var(--text);">Pre-Call AI та попередня обробка</div>
-                        <div style="font-size:10px;color:#5090c8;font-family:'JetBrains Mono',monospace;letter-spacing:0.1em;text-transform:uppercase;margin-top:2px;">ГОЛОСОВИЙ АСИСТЕНТ &middot; ІТЕРАЦІЯ 3</div>
-                      </div>
-                    </div>
-                    <div style="font-size:12.5px;color:var(--sub);line-height:1.75;margin-bottom:14px;"><b style="color:var(--text);">Завдання:</b> Pre-Call AI перехоплює вхідний дзвінок до з'єднання з живим оператором. Голосовий асистент ідентифікує клієнта, визначає тему звернення, збирає контекст, надає просту консультацію та ескалює до черги / оператора. Фокус функціоналу на швидшому наданні відповіді клієнту та зниженні навантаження на операторів.</div>
-                    <div style="font-family:'JetBrains Mono',monospace;font-size:10px;font-weight:600;color:var(--muted);letter-spacing:0.12em;text-transform:uppercase;margin-bottom:8px;">Механізм: як працює Pre-Call Flow</div>
-                    <div style="font-size:12px;color:var(--sub);line-height:1.7;margin-bottom:10px;">Pre-Call AI у UCCE реалізується через <b style="color:var(--text);">Cisco Customer Voice Portal</b> — стандартний IVR-шар у UCCE-архітектурі.</div>
-                    <details style="margin:0 0 16px;">
-                      <summary style="cursor:pointer;padding:10px 16px;background:var(--card);border:1px solid var(--border2);border-radius:6px 6px 0 0;font-family:'JetBrains Mono',monospace;font-size:11px;font-weight:600;color:var(--muted);letter-spacing:0.12em;text-transform:uppercase;list-style:none;display:flex;align-items:center;gap:8px;outline:none;user-select:none;"><span style="font-size:9px;margin-right:2px;">▶</span> CVP Flow</summary>
-                      <pre style="background:#070a11;border:1px solid var(--border2);border-top:none;border-radius:0 0 6px 6px;padding:14px 18px;font-family:'JetBrains Mono',monospace;font-size:11px;color:#5a85a8;line-height:1.75;overflow-x:auto;margin:0 0 16px;white-space:pre;">Клієнт дзвонить
-│ PSTN / SIP Trunk
-▼
-Cisco CUBE (border element)
-- SIP termination, NAT/security
-│ SIP
-▼
-Cisco CUCM 12.6 (call control)
-- Routing rule → направляє до CVP
-│ SIP
-▼
-Cisco CVP 12.6 (Customer Voice Portal)
-- VoiceXML IVR engine
-- Приймає дзвінок, запускає VXML-script
-- Native Dialogflow CX integration (Cognitive Collaboration)
-│ HTTPS Dialogflow API
-▼
-Голосовий асистент (intent detection, uk-UA)
-- Визначає тему звернення
-- Webhook → РМ КЦ для ідентифікації
-│ HTTPS Webhook
-▼
-РМ КЦ API (REST)
-GET /api/v1/customers/lookup?phone=+380501234567
-→ {{ customer_id, name, last_calls, open_cases }}
-│ Результат → CVP → CUCM routing
-▼
-CUCM Routing → Cisco Finesse (оператор)
-+ CTI screen-pop через UCCE CTI Server:
-{{ CTI screen-pop: тема, customer_id, summary }}</pre>
-                    </details>
-                    <div style="display:grid;grid-template-columns:1fr 1fr 1fr;gap:12px;margin-bottom:16px;">
-                      <div style="background:var(--card);border:1px solid var(--border2);border-radius:8px;padding:16px;">
-                        <div style="font-size:12px;font-weight:700;color:var(--text);margin-bottom:8px;">Варіант 1: Dialogflow CX</div>
-                        <div style="font-size:11.5px;color:var(--sub);line-height:1.7;">Швидкі відповіді, мало розуміння контексту, читає пряме питання/дію. </div>
-                      </div>
-                      <div style="background:var(--card);border:1px solid var(--border2);border-radius:8px;border-left:2px solid var(--ai);padding:16px;">
-                        <div style="font-size:12px;font-weight:700;color:var(--text);margin-bottom:8px;">Варіант 2: ElevenLabs </div>
-                        <ul style="margin:0 0 8px;padding-left:14px;font-size:11px;color:var(--sub);line-height:1.65;">
-                          <li style="margin-bottom:3px;">Найкраща якість української та підтверджена підтримка усіх необхідних мов</li>
-                          <li style="margin-bottom:3px;">Гнучко налаштовуються до 40 кастомних запитів менеджером. Результати автоматично передаються через post-call webhook до РМ КЦ: тема, ТТН, місто, тип проблеми, скарга, теги</li>
-                        </ul>
-                        <div style="font-size:11px;color:var(--muted);margin-top:8px;line-height:1.5;"><b>Обирати якщо:</b> результати тестування uk-UA підтверджено кращі за інших і готові платити за кращий клієнтський досвід.</div>
-                      </div>
-                      <div style="background:var(--card);border:1px solid var(--border2);border-radius:8px;padding:16px;">
-                        <div style="font-size:12px;font-weight:700;color:var(--text);margin-bottom:8px;">Варіант 3: OpenAI API (власна розробка)</div>
-                        <div style="font-size:11.5px;color:var(--sub);line-height:1.7;">Глибоке розуміння контексту, більше розуміння стану клієнта і чим викликані його дії. Уніфікована база знань із чатами. Немає обмежень платформи через власну розробку всього рішення. </div>
-                      </div>
-                    </div>
-                  <div style="font-family:'JetBrains Mono',monospace;font-size:10px;font-weight:600;color:var(--muted);letter-spacing:0.12em;text-transform:uppercase;margin-bottom:8px;">AI у кожної задачі Pre-Call AI</div>
-                    <table style="width:100%;border-collapse:collapse;font-size:11px;margin-bottom:16px;">
-                      <thead><tr style="background:var(--card);">
-                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Задача</th>
-                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Найкраща AI</th>
-                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Чому</th>
-                      </tr></thead>
-                      <tbody>
-                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Детермінований routing</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Dialogflow CX NLU</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Rule-based: "трекінг" → завжди черга Трекінг. 100% передбачуваний</td></tr>
-                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Enterprise SLA + підтримка</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Google</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Зріла компанія з документованими SLA, партнерською мережею</td></tr>
-                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Бренд-голос (TTS)</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">ElevenLabs TTS</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Єдина платформа з voice cloning — клієнт чує голос, а не роботизований Google</td></tr>
-                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Entity extraction (легке налаштування)</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">ElevenLabs</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">UI конфігурація без коду (до 40 полів). Dialogflow і OpenAI потребують розробника</td></tr>
-                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">STT uk-UA точність</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">ElevenLabs Scribe v2</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">3.1% WER, 4 акценти української</td></tr>
-                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Гнучкість бізнес-логіки</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">GPT-4o (OpenAI)</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Будь-яка логіка = текст у system prompt. Без обмежень платформи</td></tr>
-                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Складний діалог / контекст</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">GPT-4o (OpenAI)</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Найпотужніший LLM: розуміє "посилка вже тиждень не їде, я злий" як контекст ескалації</td></tr>
-                      </tbody>
-                    </table>
+                  <!-- ─── SECTION 5: PRE-CALL AI ─── -->
+                  <div style="background:var(--card);border:1px solid var(--border2);border-radius:12px;padding:24px;margin-bottom:24px;">
+                    <div style="display:flex;align-items:center;gap:12px;margin-bottom:14px;">
+                      <div style="width:30px;height:30px;border-radius:50%;background:#0d4372;display:flex;align-items:center;justify-content:center;color:#fff;font-weight:700;font-size:13px;flex-shrink:0;">5</div>
+                      <div>
+                        <div style="font-size:15px;font-weight:700;color:var(--text);">Pre-Call AI та попередня обробка</div>
+                        <div style="font-size:10px;color:#5090c8;font-family:'JetBrains Mono',monospace;letter-spacing:0.1em;text-transform:uppercase;margin-top:2px;">ГОЛОСОВИЙ АСИСТЕНТ &middot; ІТЕРАЦІЯ 3</div>
+                      </div>
+                    </div>
+                    <div style="font-size:12.5px;color:var(--sub);line-height:1.75;margin-bottom:14px;"><b style="color:var(--text);">Завдання:</b> Pre-Call AI перехоплює вхідний дзвінок до з'єднання з живим оператором. Голосовий асистент ідентифікує клієнта, визначає тему звернення, збирає контекст, надає просту консультацію та ескалює до черги / оператора. Фокус функціоналу на швидшому наданні відповіді клієнту та зниженні навантаження на операторів.</div>
+                    <div style="font-family:'JetBrains Mono',monospace;font-size:10px;font-weight:600;color:var(--muted);letter-spacing:0.12em;text-transform:uppercase;margin-bottom:8px;">Механізм: як працює Pre-Call Flow</div>
+                    <div style="font-size:12px;color:var(--sub);line-height:1.7;margin-bottom:10px;">Pre-Call AI у UCCE реалізується через <b style="color:var(--text);">Cisco Customer Voice Portal</b> — стандартний IVR-шар у UCCE-архітектурі.</div>
+                    <details style="margin:0 0 16px;">
+                      <summary style="cursor:pointer;padding:10px 16px;background:var(--card);border:1px solid var(--border2);border-radius:6px 6px 0 0;font-family:'JetBrains Mono',monospace;font-size:11px;font-weight:600;color:var(--muted);letter-spacing:0.12em;text-transform:uppercase;list-style:none;display:flex;align-items:center;gap:8px;outline:none;user-select:none;"><span style="font-size:9px;margin-right:2px;">▶</span> CVP Flow</summary>
+                      <pre style="background:#070a11;border:1px solid var(--border2);border-top:none;border-radius:0 0 6px 6px;padding:14px 18px;font-family:'JetBrains Mono',monospace;font-size:11px;color:#5a85a8;line-height:1.75;overflow-x:auto;margin:0 0 16px;white-space:pre;">Клієнт дзвонить
+│ PSTN / SIP Trunk
+▼
+Cisco CUBE (border element)
+- SIP termination, NAT/security
+│ SIP
+▼
+Cisco CUCM 12.6 (call control)
+- Routing rule → направляє до CVP
+│ SIP
+▼
+Cisco CVP 12.6 (Customer Voice Portal)
+- VoiceXML IVR engine
+- Приймає дзвінок, запускає VXML-script
+- Native Dialogflow CX integration (Cognitive Collaboration)
+│ HTTPS Dialogflow API
+▼
+Голосовий асистент (intent detection, uk-UA)
+- Визначає тему звернення
+- Webhook → РМ КЦ для ідентифікації
+│ HTTPS Webhook
+▼
+РМ КЦ API (REST)
+GET /api/v1/customers/lookup?phone=+380501234567
+→ { customer_id, name, last_calls, open_cases }
+│ Результат → CVP → CUCM routing
+▼
+CUCM Routing → Cisco Finesse (оператор)
++ CTI screen-pop через UCCE CTI Server:
+{ CTI screen-pop: тема, customer_id, summary }</pre>
+                    </details>
+                    <div style="display:grid;grid-template-columns:1fr 1fr 1fr;gap:12px;margin-bottom:16px;">
+                      <div style="background:var(--card);border:1px solid var(--border2);border-radius:8px;padding:16px;">
+                        <div style="font-size:12px;font-weight:700;color:var(--text);margin-bottom:8px;">Варіант 1: Dialogflow CX</div>
+                        <div style="font-size:11.5px;color:var(--sub);line-height:1.7;">Швидкі відповіді, мало розуміння контексту, читає пряме питання/дію. </div>
+                      </div>
+                      <div style="background:var(--card);border:1px solid var(--border2);border-radius:8px;border-left:2px solid var(--ai);padding:16px;">
+                        <div style="font-size:12px;font-weight:700;color:var(--text);margin-bottom:8px;">Варіант 2: ElevenLabs </div>
+                        <ul style="margin:0 0 8px;padding-left:14px;font-size:11px;color:var(--sub);line-height:1.65;">
+                          <li style="margin-bottom:3px;">Найкраща якість української та підтверджена підтримка усіх необхідних мов</li>
+                          <li style="margin-bottom:3px;">Гнучко налаштовуються до 40 кастомних запитів менеджером. Результати автоматично передаються через post-call webhook до РМ КЦ: тема, ТТН, місто, тип проблеми, скарга, теги</li>
+                        </ul>
+                        <div style="font-size:11px;color:var(--muted);margin-top:8px;line-height:1.5;"><b>Обирати якщо:</b> результати тестування uk-UA підтверджено кращі за інших і готові платити за кращий клієнтський досвід.</div>
+                      </div>
+                      <div style="background:var(--card);border:1px solid var(--border2);border-radius:8px;padding:16px;">
+                        <div style="font-size:12px;font-weight:700;color:var(--text);margin-bottom:8px;">Варіант 3: OpenAI API (власна розробка)</div>
+                        <div style="font-size:11.5px;color:var(--sub);line-height:1.7;">Глибоке розуміння контексту, більше розуміння стану клієнта і чим викликані його дії. Уніфікована база знань із чатами. Немає обмежень платформи через власну розробку всього рішення. </div>
+                      </div>
+                    </div>
+                  <div style="font-family:'JetBrains Mono',monospace;font-size:10px;font-weight:600;color:var(--muted);letter-spacing:0.12em;text-transform:uppercase;margin-bottom:8px;">AI у кожної задачі Pre-Call AI</div>
+                    <table style="width:100%;border-collapse:collapse;font-size:11px;margin-bottom:16px;">
+                      <thead><tr style="background:var(--card);">
+                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Задача</th>
+                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Найкраща AI</th>
+                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Чому</th>
+                      </tr></thead>
+                      <tbody>
+                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Детермінований routing</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Dialogflow CX NLU</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Rule-based: "трекінг" → завжди черга Трекінг. 100% передбачуваний</td></tr>
+                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Enterprise SLA + підтримка</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Google</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Зріла компанія з документованими SLA, партнерською мережею</td></tr>
+                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Бренд-голос (TTS)</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">ElevenLabs TTS</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Єдина платформа з voice cloning — клієнт чує голос, а не роботизований Google</td></tr>
+                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Entity extraction (легке налаштування)</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">ElevenLabs</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">UI конфігурація без коду (до 40 полів). Dialogflow і OpenAI потребують розробника</td></tr>
+                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">STT uk-UA точність</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">ElevenLabs Scribe v2</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">3.1% WER, 4 акценти української</td></tr>
+                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Гнучкість бізнес-логіки</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">GPT-4o (OpenAI)</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Будь-яка логіка = текст у system prompt. Без обмежень платформи</td></tr>
+                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Складний діалог / контекст</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">GPT-4o (OpenAI)</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Найпотужніший LLM: розуміє "посилка вже тиждень не їде, я злий" як контекст ескалації</td></tr>
+                      </tbody>
+                    </table>
+
+                    <div style="font-family:'JetBrains Mono',monospace;font-size:10px;font-weight:600;color:var(--muted);letter-spacing:0.12em;text-transform:uppercase;margin-bottom:8px;">Оцінка вартості</div>
+                    <table style="width:100%;border-collapse:collapse;font-size:11.5px;">
+                      <thead><tr style="background:var(--card);">
+                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Варіант</th>
+                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Модель</th>
+                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Розробка</th>
+                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">API вартість/міс</th>
+                      </tr></thead>
+                      <tbody>
+                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Варіант 1: Dialogflow CX</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Vendor-managed</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">~$20–40K</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">~$81,200</td></tr>
+                        <tr style="background:rgba(48,216,144,.04);"><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Варіант 2: ElevenLabs </td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Vendor-managed</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">~$15–25K</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">~$90,000–120,000</td></tr>
+                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Варіант 3: OpenAI API</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Власна розробка</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Вартість годин команди + ~$40–70K</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">~$43,000–81,000</td></tr>
+                      </tbody>
+                    </table>
+                  </div>
+
+                </div>
+            </div>
+        </div>"""
+
+
+def generate_recommendations_tab(final_scores: Dict[str, str]) -> str:
+    """Generate HTML for the recommendations tab."""
+
+    def _score(provider: str) -> str:
+        raw = final_scores.get(provider, "—")
+        return raw if raw.endswith("%") else (raw + "%" if raw != "—" else raw)
+
+    # ------------------------------------------------------------------
+    # Priority provider cards (full-width)
+    # ------------------------------------------------------------------
+    cresta_card = _render_strategy_card(
+        border_rgba="rgba(34,211,238,.3)",
+        label_color="#22d3ee",
+        label_text="Real-Time Assist · Agent Copilot · #1 Score",
+        score_text=_score("Cresta"),
+        title="Cresta AI",
+        subtitle="Real-Time Assist · Agent Copilot · Ocean-1",
+        indent="                    ",
+        pros=[
+            "Ocean-1: власна модель від ех-співробітників OpenAI з мультимовною підтримкою",
+            "Найкращий Copilot на ринку, глибока постобробка, нативна інтеграція у робоче місце оператора, висока точність аналітики",
+            "Cresta має українське венчурне коріння від фонду Roosh Ventures Сергія Токарєва (раунд $80 млн у 2022)",
+            "Email-підтримка як повноцінний канал комунікації",
+        ],
+        cons=[
+            "Потребує тестування діалогів та суржику — авторезюме, заповнення тематик, полів та маркування розмов",
+            "Відсутність нативної інтеграції з Binotel, Power Platform, Power BI",
+            "Тривале налаштування та непрозора вартість розробки",
+        ],
+    )
+
+    google_card = _render_strategy_card(
+        border_rgba="rgba(245,200,66,.3)",
+        label_color="#f5c842",
+        label_text="Enterprise-рішення · #2 Score",
+        score_text=_score("Google Cloud CCAI"),
+        title="Google Cloud CCAI",
+        subtitle="Contact Center AI · Agent Assist · Dialogflow CX · Gemini",
+        indent="                    ",
+        pros=[
+            "Нативна підтримка української мови з кращим авторезюме. Підтримка 100+ мов через Google NLU",
+            "Спеціалізована telephony-модель, навчена на аудіо телефонних ліній та IVR-систем",
+            "Gemini — один з найпотужніших LLM у світі",
+            "Нативна інтеграція з Cisco",
+            "Повний стек із набору інструментів. Гнучка компонентна архітектура (оплата лише за необхідний функціонал)",
+        ],
+        cons=[
+            "Потребує тестування діалогів та суржику — авторезюме, заповнення тематик, полів та маркування розмов",
+            "Відсутність нативної інтеграції з Binotel, Power Platform, Power BI",
+            "Складність адміністрування та дорога вартість розробки",
+            "Складність налаштування повного стеку",
+        ],
+    )
+
+    ender_card = _render_strategy_card(
+        border_rgba="rgba(62,207,142,.25)",
+        label_color="#10b981",
+        label_text="Співвідношення ціна / якість",
+        score_text=_score("Ender Turing"),
+        title="Ender Turing",
+        subtitle="Локальний продукт із найкращим розумінням українського говору",
+        indent="                    ",
+        pros=[
+            "Найкраща генерація резюме розмов",
+            "Модулі аналітики та якісне навчання операторів",
+            "Підтверджений досвід у NovaPay",
+            "100% автоматизований контроль якості. Аналітика рівня світових продуктів",
+        ],
+        cons=[
+            "Відсутній інструмент підказок у реальному часі — не є асистентом оператора під час дзвінка",
+            "Немає функцій Pre-Call AI (голосовий бот / заміна IVR)",
+            "Слабші інтеграційні можливості — потрібна розробка API з усіма системами",
+            "Алгоритми ACW поступаються якістю великим мовним моделям (GPT, Gemini)",
+        ],
+    )
+
+    unitalk_card = _render_strategy_card(
+        border_rgba="rgba(156,163,175,.25)",
+        label_color="var(--muted)",
+        label_text="Call Recording · Voice Bot",
+        score_text=_score("Uni Talk"),
+        title="Uni Talk",
+        subtitle="Локальний продукт · Голосовий бот",
+        indent="                    ",
+        pros=[
+            "Український продукт із функціоналом голосового бота",
+            "Швидкий і безкоштовний пілот",
+            "Інтуїтивне адміністрування та зручний інтерфейс для менеджерів",
+            "Швидкий онбординг після підписання контракту",
+        ],
+        cons=[
+            "Відсутній функціонал копайлота",
+            "Максимум 15 API-запитів на секунду",
+            "Немає авторезюме дзвінка, лише транскрибація і таймлайни",
+            "Відсутня автоматична оцінка якості та аналітика",
+            "Слабке тегування та маркування розмов",
+            "Моноліт. Рішення передбачає свою телефонію",
+        ],
+    )
+
+    # ------------------------------------------------------------------
+    # Secondary provider cards (2-column grid rows)
+    # ------------------------------------------------------------------
+    microsoft_card = _render_strategy_card(
+        border_rgba="rgba(74,158,255,.25)",
+        label_color="var(--accent-text)",
+        label_text="AI Ecosystem · Azure OpenAI",
+        score_text=_score("Microsoft Copilot"),
+        title="Microsoft Copilot",
+        subtitle="Dynamics 365 · Power Platform",
+        indent="                    ",
+        pros=[
+            "Висока швидкість і точність Next Best Action для вирішення запитів",
+            "Найкращий пошук із завантаженою базою знань із наданням прямих посилань на документи",
+            "Гнучка адаптація відповідей під контекст розмови",
+            "Безшовна передача даних аналітики у внутрішні системи звітності",
+            "Найвищий рівень маскування чутливих даних клієнтів",
+        ],
+        cons=[
+            "Слабше автоматичне перенесення даних саме з україномовних розмов",
+            "Фокус інструментарію платформи зроблено на текстові канали зв'язку",
+            "Висока вартість ліцензій та складність налаштування",
+            "Обмежена автоматизація процесу у кейсах: з 7 до 4хв",
+        ],
+    )
+
+    nice_card = _render_strategy_card(
+        border_rgba="rgba(168,85,247,.25)",
+        label_color="#a855f7",
+        label_text="Enterprise Cloud Contact Center",
+        score_text=_score("NICE"),
+        title="NICE",
+        subtitle="Enlighten AI · Autopilot",
+        indent="                    ",
+        pros=[
+            "Швидкість аналізу контексту у реальному часі займає до 2 секунд",
+            "Copilot-функціонал для супроводу оператора (підказки, генерація скриптів)",
+            "Наявність професійного вбудованого модуля WFM",
+            "Розвинені інструменти автоматичного навчання операторів",
+        ],
+        cons=[
+            "Глобальна міграція — повноцінна інфраструктурна платформа",
+            "Необхідність тестування української мови для авторезюме (ACW)",
+            "Слабше розпізнавання суржику порівняно з локальними продуктами",
+            "Довгий та складний процес впровадження",
+        ],
+    )
+
+    genesys_card = _render_strategy_card(
+        border_rgba="rgba(251,146,60,.25)",
+        label_color="#fb923c",
+        label_text="Contact Center as a Service",
+        score_text=_score("Genesys Cloud CX"),
+        title="Genesys Cloud CX",
+        subtitle="Genesys AI · Agent Assist",
+        indent="                    ",
+        pros=[
+            "Надійний модуль Agent Assist із високою швидкістю підказок",
+            "Відмінне автоматичне маскування чутливої інформації",
+            "Зручне low-code налаштування без залучення ІТ",
+            "Високий рівень масштабування та витривалість",
+        ],
+        cons=[
+            "Глобальна міграція — повноцінна платформа, що потребує переїзду",
+            "Низька точність STT для українського аудіо",
+            "Потенційні складнощі з визначенням глибоких підтематик",
+            "Відсутні інструменти для ШІ-перевірки по чек-листу",
+        ],
+    )
+
+    cognigy_card = _render_strategy_card(
+        border_rgba="rgba(168,85,247,.25)",
+        label_color="#a855f7",
+        label_text="Conversational AI · Bot-first",
+        score_text=_score("NICE Cognigy"),
+        title="NICE Cognigy",
+        subtitle="Omnichannel",
+        indent="                    ",
+        pros=[
+            "Потужний Pre-Call AI — лідер у створенні голосових ботів",
+            "Зручні візуальні конструктори low-code",
+            "Висока швидкість NBA та відмінний пошук по документації",
+        ],
+        cons=[
+            "Немає підтверджень генерації українською авторезюме",
+            "Складнощі зі швидкістю маркування та фільтрації даних",
+            "Гірші можливості для передачі даних у кастомне робоче місце",
+        ],
+    )
+
+    liveperson_card = _render_strategy_card(
+        border_rgba="rgba(156,163,175,.25)",
+        label_color="var(--muted)",
+        label_text="Text-first · AI Chatbots",
+        score_text=_score("Live Person"),
+        title="Live Person",
+        subtitle="Conversational Cloud",
+        indent="                    ",
+        pros=[
+            "Сильний інструментарій для чатів, месенджерів та NBA у тексті",
+            "Високий рівень захисту та автоматичного маскування даних",
+        ],
+        cons=[
+            "Відсутнє підтвердження якісного розуміння українського голосу та суржику",
+            "Контроль якості дзвінків відсутній по чек-листах",
+            "Значне відставання у функціоналі ACW",
+        ],
+    )
+
+    ringostat_card = _render_strategy_card(
+        border_rgba="rgba(156,163,175,.25)",
+        label_color="var(--muted)",
+        label_text="Call Tracking · Cloud PBX",
+        score_text=_score("Ringostat"),
+        title="Ringostat",
+        subtitle="AI Analytics",
+        indent="                    ",
+        pros=[
+            "Швидкий та безкоштовний запуск тестового періоду",
+            "Відмінний базовий рівень розпізнавання української мови та суржику",
+            "Зрозумілі дашборди та висока здатність перетравлювати великі потоки даних",
+        ],
+        cons=[
+            "Фокус продукту на продажі, маркетинг та аналіз реклами",
+            "Відсутність Copilot-функцій",
+            "Слабкі можливості ACW та класифікації тематик",
+            "Відсутня архітектура для глибокої взаємодії з API",
+        ],
+    )
+
+    decagon_card = _render_strategy_card(
+        border_rgba="rgba(156,163,175,.25)",
+        label_color="var(--muted)",
+        label_text="Generative AI · Text-first",
+        score_text=_score("Decagon"),
+        title="Decagon",
+        subtitle="Customer Support Automation",
+        indent="                    ",
+        pros=[
+            "Сильні інструменти для текстових скриптів та пошуку по документації",
+            "Інтерфейс налаштувань інтуїтивно зрозумілий",
+            "Швидкий старт пілотного проєкту на реальних даних",
+            "Розгортають співпрацю із 11labs",
+        ],
+        cons=[
+            "Відсутність української голосової моделі для транскрибації",
+            "Слабкі модулі аналітики та автоматичного контролю якості (QA)",
+        ],
+    )
+
+    polyai_card = _render_strategy_card(
+        border_rgba="rgba(156,163,175,.25)",
+        label_color="var(--muted)",
+        label_text="Voice Assistants · Conversational IVR",
+        score_text=_score("Poly AI"),
+        title="Poly AI",
+        subtitle="Voice Assistants",
+        indent="                    ",
+        pros=[
+            "Вузька спеціалізація у голосових асистентах (Pre-Call, заміна IVR)",
+            "Здатність витримувати величезну кількість одночасних розмов",
+            "Надійні протоколи захисту даних",
+        ],
+        cons=[
+            "Менша швидкість обробки ШІ та глибина розуміння української",
+            "Відсутні підказки та супровід живого оператора",
+            "Немає інструментів для постобробки та аналітики",
+        ],
+    )
+
+    getvocal_card = _render_strategy_card(
+        border_rgba="rgba(156,163,175,.25)",
+        label_color="var(--muted)",
+        label_text="Local Voice · AI Provider",
+        score_text=_score("Get Vocal"),
+        title="Get Vocal",
+        subtitle="Local Voice AI",
+        indent="                    ",
+        pros=[
+            "Швидкий старт, готовність до локальної співпраці та недорогий тест",
+            "Готовий функціонал безшовної ескалації розмови з бота на оператора",
+        ],
+        cons=[
+            "Функціональне відставання швидкості роботи ШІ та поверхневе розуміння української",
+            "Відсутність функціоналу пошуку Copilot, модуля ACW та аналітики",
+            "Слабке розпізнавання суржику та недостатній аналіз емоцій",
+            "Не вказано у документації функціонал українською та аналіз емоцій",
+        ],
+    )
 
-                    <div style="font-family:'JetBrains Mono',monospace;font-size:10px;font-weight:600;color:var(--muted);letter-spacing:0.12em;text-transform:uppercase;margin-bottom:8px;">Оцінка вартості</div>
-                    <table style="width:100%;border-collapse:collapse;font-size:11.5px;">
-                      <thead><tr style="background:var(--card);">
-                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Варіант</th>
-                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Модель</th>
-                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">Розробка</th>
-                        <th style="padding:7px 10px;text-align:left;border:1px solid var(--border2);color:var(--muted);font-weight:600;">API вартість/міс</th>
-                      </tr></thead>
-                      <tbody>
-                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Варіант 1: Dialogflow CX</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Vendor-managed</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">~$20–40K</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">~$81,200</td></tr>
-                        <tr style="background:rgba(48,216,144,.04);"><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Варіант 2: ElevenLabs </td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Vendor-managed</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">~$15–25K</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">~$90,000–120,000</td></tr>
-                        <tr><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Варіант 3: OpenAI API</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Власна розробка</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">Вартість годин команди + ~$40–70K</td><td style="padding:7px 10px;border:1px solid var(--border2);color:var(--sub);">~$43,000–81,000</td></tr>
-                      </tbody>
-                    </table>
-                  </div>
+    elevenlabs_card = _render_strategy_card(
+        border_rgba="rgba(156,163,175,.25)",
+        label_color="var(--accent-text)",
+        label_text="Голосовий асистент · STT-шар",
+        score_text=_score("11 Labs"),
+        title="ElevenLabs",
+        subtitle="Speech-to-Text · Scribe v2 · Streaming · Pre-Call",
+        indent="                    ",
+        pros=[
+            "Голосовий асистент та маршрутизація (Pre-Call)",
+            "STT — висока точність розпізнавання мови",
+            "Scribe v2 забезпечує розпізнавання суржику",
+            "Стрімінгова передача тексту із затримкою ~500 мс",
+            "Нативна Cisco-інтеграція",
+            "Сертифікації безпеки",
+        ],
+        cons=[
+            "Не є Copilot-рішенням — лише надає транскрибацію у систему",
+            "Відсутній функціонал ACW, аналітики та не може замінити IVR",
+        ],
+    )
 
-                </div>
-            </div>
-        </div>"""
+    verint_card = _render_strategy_card(
+        border_rgba="rgba(59,130,246,.25)",
+        label_color="#3b82f6",
+        label_text="Enterprise WEM · Da Vinci AI",
+        score_text=_score("Verint"),
+        title="Verint",
+        subtitle="CX Automation Platform · Da Vinci AI · WFM Leader",
+        indent="                    ",
+        pros=[
+            "Функціонал українською підтверджена документацією (Verint Speech Transcription, on-prem, LVCSR)",
+            "Зафіксований продукт представництва NovaIT",
+        ],
+        cons=[
+            "Sentiment, Topics, Auto Language Detection — тільки через Communications Analytics, підтримка української не підтверджена",
+            "Транскрипція українською доступна лише on-premise (Verint Speech Transcription), не в хмарі",
+            "Відсутність успішних кейсів в Україні",
+            "Очікувана вартість $200-350K/рік",
+            "Немає підтримки мов країн присутності",
+        ],
+    )
+
+    # Sort all recommendation cards by score descending, 3 per row
+    _all_rec_cards = [
+        (cresta_card, _score("Cresta")),
+        (google_card, _score("Google Cloud CCAI")),
+        (ender_card, _score("Ender Turing")),
+        (unitalk_card, _score("Uni Talk")),
+        (microsoft_card, _score("Microsoft Copilot")),
+        (nice_card, _score("NICE")),
+        (genesys_card, _score("Genesys Cloud CX")),
+        (cognigy_card, _score("NICE Cognigy")),
+        (liveperson_card, _score("Live Person")),
+        (ringostat_card, _score("Ringostat")),
+        (decagon_card, _score("Decagon")),
+        (polyai_card, _score("Poly AI")),
+        (elevenlabs_card, _score("11 Labs")),
+        (getvocal_card, _score("Get Vocal")),
+        (verint_card, _score("Verint")),
+    ]
+    _all_rec_cards.sort(
+        key=lambda x: _parse_score_float(x[1]),
+        reverse=True,
+    )
+    _n = len(_all_rec_cards)
+    _chunks = [[c[0] for c in _all_rec_cards[i : i + 3]] for i in range(0, _n, 3)]
+    rec_provider_grid = "\n\n".join(
+        f'                <div style="display:grid;grid-template-columns:repeat({len(_chunk)},1fr);gap:16px;margin-bottom:{"20px" if i == len(_chunks) - 1 else "16px"};">\n'
+        + "\n".join(_chunk)
+        + "\n                </div>"
+        for i, _chunk in enumerate(_chunks)
+    )
+
+    return _RECOMMENDATIONS_HEAD_HTML + rec_provider_grid + _RECOMMENDATIONS_TAIL_HTML
 
 
 def generate_asis_tab() -> str:
@@ -2116,81 +2277,15 @@ def generate_tobe_tab() -> str:
     </div>"""
 
 
-def generate_html(
-    categories: Dict[str, Category],
-    final_scores: Dict[str, str],
-    tco_values: Dict[str, str],
-    asis_bpmn_xml: str = "",
-    tobe_bpmn_xml: str = "",
-) -> str:
-    """Generate the complete HTML document."""
-    # Sort providers by final score descending
-    def _sort_key(p: str) -> float:
-        raw = final_scores.get(p, "0%")
-        try:
-            return float(str(raw).replace("%", "").replace(",", "."))
-        except (ValueError, AttributeError):
-            return 0.0
-
-    sorted_providers = sorted(PROVIDERS, key=_sort_key, reverse=True)
-
-    # Per-provider dict of category subtotal strings
-    category_scores: Dict[str, Dict[str, str]] = {
-        provider: {
-            cat_id: cat.subtotals.get(provider, "0%")
-            for cat_id, cat in categories.items()
-        }
-        for provider in PROVIDERS
-    }
-
-    max_weights = {cat_id: cat.weight_percent for cat_id, cat in categories.items()}
-
-    _all_cards = [
-        generate_provider_card(
-            provider,
-            rank,
-            final_scores.get(provider, "0%"),
-            tco_values.get(provider, "N/A"),
-            category_scores[provider],
-            max_weights,
-        )
-        for rank, provider in enumerate(sorted_providers, 1)
-    ]
-    # 5 rows × 3 providers per row
-    _rows = []
-    for _idx in range(0, len(_all_cards), 3):
-        _chunk = _all_cards[_idx : _idx + 3]
-        if _chunk:
-            _rows.append(
-                '<div class="fs-row fs-row-3">\n'
-                + "\n".join(_chunk)
-                + "\n</div>"
-            )
-    provider_cards = "\n".join(_rows)
-
-    category_order = ["copilot", "acw", "analytics", "precall", "it", "business"]
-    category_tabs = "\n".join(
-        generate_category_tab(cat_id, categories[cat_id], sorted_providers)
-        for cat_id in category_order
-        if cat_id in categories
-    )
+# ---------------------------------------------------------------------------
+# Static page fragments
+# ---------------------------------------------------------------------------
 
-    winner = sorted_providers[0] if sorted_providers else "N/A"
-    winner_score = final_scores.get(winner, "0%")
-
-    # Build BPMN data script separately to avoid f-string escaping issues
-    _asis_js = json.dumps(asis_bpmn_xml)
-    _tobe_js = json.dumps(tobe_bpmn_xml)
-    _bpmn_data_script = (
-        "<script>\n"
-        "window.__bpmnData = {\n"
-        "  asis: " + _asis_js + ",\n"
-        "  tobe: " + _tobe_js + "\n"
-        "};\n"
-        "</script>"
-    )
+# Everything below is independent of the CSV, so it is built once at import
+# time; write_html only formats the dynamic parts between these fragments.
 
-    _html = f"""<!DOCTYPE html>
+# <head> up to the opening <style> tag; the stylesheet follows.
+_HTML_HEAD_OPEN = """<!DOCTYPE html>
 <html lang="uk">
 <head>
     <meta charset="UTF-8">
@@ -2200,8 +2295,15 @@ def generate_html(
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
     <style>
+"""
 
-        :root {{
+# Readable source of the page stylesheet. It is not emitted as-is: write_html()
+# inlines _CSS_MIN, the _minify_css() output computed at import (see below), so
+# the <style> block will not match this text byte for byte. This is a plain
+# string rather than part of an f-string template, so CSS braces are written
+# as-is, without doubling.
+_CSS = """
+        :root {
             --bg: #080b12;
             --bg2: #0d1320;
             --card-bg: #0d1320;
@@ -2219,41 +2321,47 @@ def generate_html(
             --accent-text: #60a5fa;
             --accent-bg: rgba(59,130,246,.08);
             --accent-b: rgba(59,130,246,.2);
+            --green: #10b981;
+            --red: #ef4444;
+            --amber: #f59e0b;
+            --white-3: rgba(255,255,255,.03);
+            --white-5: rgba(255,255,255,.05);
+            --white-10: rgba(255,255,255,.1);
             --radius-card: 12px;
             --radius-inner: 8px;
             --radius-sm: 4px;
-        }}
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             background: linear-gradient(135deg, #0a0e27 0%, #1a1f3a 100%);
             color: #e0e6ed;
             line-height: 1.6;
             min-height: 100vh;
             padding: 20px;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1500px;
             margin: 0 auto;
-        }}
+        }
 
-        header {{
+        header {
             background: var(--card-bg);
             border: 1px solid var(--border);
             border-radius: var(--radius-card);
             padding: 32px;
             margin-bottom: 40px;
             backdrop-filter: blur(10px);
-        }}
+        }
 
-        .header-tag {{
+        .header-tag {
             display: inline-block;
             background: var(--accent-bg);
             color: var(--accent-text);
@@ -2264,104 +2372,53 @@ def generate_html(
             text-transform: uppercase;
             letter-spacing: 0.5px;
             margin-bottom: 16px;
-        }}
+        }
 
-        h1 {{
+        h1 {
             font-size: 48px;
             font-weight: 700;
             margin-bottom: 12px;
-            background: linear-gradient(135deg, #ffffff 0%, #60a5fa 100%);
+            background: linear-gradient(135deg, #ffffff 0%, var(--accent-text) 100%);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             background-clip: text;
-        }}
+        }
 
-        .subtitle {{
+        .subtitle {
             font-size: 18px;
             color: var(--muted);
             line-height: 1.8;
             max-width: 800px;
-        }}
+        }
 
-        .legend {{
+        .legend {
             display: flex;
             flex-wrap: wrap;
             gap: 16px;
             margin: 30px 0;
-        }}
+        }
 
-        .legend-item {{
+        .legend-item {
             display: flex;
             align-items: center;
             gap: 8px;
             font-size: 13px;
-        }}
+        }
 
-        .legend-dot {{
+        .legend-dot {
             width: 12px;
             height: 12px;
             border-radius: 50%;
-        }}
-
-        .legend-dot.enterprise {{ background: #10b981; }}
-        .legend-dot.needs-config {{ background: #f59e0b; }}
-        .legend-dot.incomplete {{ background: #ef4444; }}
-        .legend-dot.must {{ background: #ef4444; }}
-        .legend-dot.should {{ background: #f59e0b; }}
-        .legend-dot.could {{ background: #60a5fa; }}
-
-        .winner-card {{
-            background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(59, 130, 246, 0.1) 100%);
-            border: 2px solid rgba(16, 185, 129, 0.3);
-            border-radius: 20px;
-            padding: 32px;
-            margin-bottom: 40px;
-            position: relative;
-            overflow: hidden;
-        }}
-
-        .winner-card::before {{
-            content: '🏆';
-            position: absolute;
-            top: 20px;
-            right: 20px;
-            font-size: 48px;
-            opacity: 0.3;
-        }}
-
-        .winner-badge {{
-            display: inline-block;
-            background: rgba(16, 185, 129, 0.2);
-            color: #10b981;
-            padding: 8px 20px;
-            border-radius: 24px;
-            font-size: 13px;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 0.8px;
-            margin-bottom: 16px;
-        }}
-
-        .winner-name {{
-            font-size: 36px;
-            font-weight: 700;
-            margin-bottom: 8px;
-        }}
-
-        .winner-score {{
-            font-size: 64px;
-            font-weight: 800;
-            color: #10b981;
-            margin: 16px 0;
-        }}
-
-        .winner-description {{
-            font-size: 15px;
-            color: #d1d5db;
-            line-height: 1.7;
-        }}
+        }
 
-        .tabs {{
+        .legend-dot.enterprise { background: var(--green); }
+        .legend-dot.needs-config { background: var(--amber); }
+        .legend-dot.incomplete { background: var(--red); }
+        .legend-dot.must { background: var(--red); }
+        .legend-dot.should { background: var(--amber); }
+        .legend-dot.could { background: var(--accent-text); }
+
+        .tabs {
             display: flex;
             justify-content: center;
             align-items: center;
@@ -2371,112 +2428,100 @@ def generate_html(
             padding: 12px;
             border-radius: var(--radius-card);
             overflow-x: auto;
-        }}
+        }
 
-        .tab {{
+        .tab {
             padding: 12px 24px;
             background: transparent;
-            border: 1px solid rgba(255, 255, 255, 0.1);
+            border: 1px solid var(--white-10);
             border-radius: 8px;
             color: var(--muted);
             cursor: pointer;
-            transition: all 0.3s ease;
+            transition: background-color 150ms, border-color 150ms, color 150ms;
             font-size: 14px;
             font-weight: 600;
             white-space: nowrap;
-        }}
+        }
 
-        .tab:hover {{
-            background: rgba(255, 255, 255, 0.05);
+        .tab:hover {
+            background: var(--white-5);
             border-color: rgba(255, 255, 255, 0.2);
-        }}
+        }
 
-        .tab.active {{
+        .tab.active {
             background: var(--accent-bg);
             border-color: var(--accent-text);
             color: var(--accent-text);
-        }}
+        }
 
-        .tab-content {{
+        .tab-content {
             display: none;
-        }}
+        }
 
-        .tab-content.active {{
+        .tab-content.active {
             display: block;
-        }}
-
-        .bpmn-section {{ padding: 24px 0; }}
-        .bpmn-scroll-wrap {{ overflow: auto; max-height: 700px; border: 1px solid #252e45; border-radius: 8px; margin: 0 0 24px; background: #080b12; }}
-        .bpmn-viewer-wrap {{ position: relative; height: 600px; border: 1px solid #252e45; border-radius: 8px; margin: 0 0 24px; background: var(--card-bg); overflow: hidden; }}
-        .bpmn-controls {{ position: absolute; top: 10px; right: 10px; z-index: 10; display: flex; flex-direction: column; gap: 4px; }}
-        .bpmn-ctrl-btn {{ width: 32px; height: 32px; background: rgba(10,15,28,.85); border: 1px solid #2a3a5a; border-radius: 6px; color: #a0b4d0; font-size: 16px; line-height: 1; cursor: pointer; display: flex; align-items: center; justify-content: center; backdrop-filter: blur(4px); }}
-        .bpmn-ctrl-btn:hover {{ background: rgba(30,50,90,.95); color: #fff; }}
-        .bpmn-hero {{ display: flex; justify-content: space-between; align-items: flex-start; padding: 0 0 16px; gap: 16px; }}
-        .bpmn-eyebrow {{ font-size: 11px; font-weight: 700; letter-spacing: .08em; text-transform: uppercase; margin-bottom: 4px; }}
-        .bpmn-title {{ font-size: 20px; font-weight: 700; margin-bottom: 6px; }}
-        .bpmn-lead {{ font-size: 12px; color: var(--muted); line-height: 1.6; }}
-        .bpmn-chips {{ display: flex; gap: 6px; flex-wrap: wrap; }}
-        .bpmn-chip {{ font-size: 10px; padding: 3px 10px; border-radius: 20px; border: 1px solid; }}
-        .bpmn-legend {{ display: flex; gap: 16px; flex-wrap: wrap; align-items: center; padding: 0 0 12px; font-size: 11px; color: var(--muted); }}
-        .bpmn-leg {{ display: flex; align-items: center; gap: 6px; }}
-        .bpmn-problems {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 12px; margin-top: 20px; }}
-        .bpmn-prob-card {{ background: rgba(255,255,255,.03); border: 1px solid rgba(255,70,40,.15); border-radius: 8px; padding: 14px; }}
-        .bpmn-prob-title {{ font-size: 12px; font-weight: 700; color: #ff7040; margin-bottom: 6px; }}
-        .bpmn-prob-text {{ font-size: 11px; color: var(--muted); line-height: 1.6; }}
-        .bpmn-benefit-card {{ background: rgba(255,255,255,.03); border: 1px solid rgba(48,216,144,.15); border-radius: 8px; padding: 14px; }}
-        .bpmn-benefit-title {{ font-size: 12px; font-weight: 700; color: #30d890; margin-bottom: 6px; }}
-        .bpmn-benefit-text {{ font-size: 11px; color: var(--muted); line-height: 1.6; }}
-
-        .comparison-table {{
+        }
+
+        .comparison-table {
             background: var(--card-bg);
             border: 1px solid var(--border);
             border-radius: var(--radius-card);
             overflow-x: auto;
             margin-bottom: 32px;
-        }}
+        }
 
-        .comparison-table > * {{
+        .comparison-table > * {
             min-width: max-content;
-        }}
+        }
 
-        .table-header {{
+        .table-header {
             display: grid;
             gap: 1px;
-            background: rgba(255, 255, 255, 0.05);
+            background: var(--white-5);
             padding: 16px;
             font-weight: 600;
             font-size: 12px;
             text-align: center;
-        }}
+        }
 
-        .provider-column {{
+        .provider-column {
             line-height: 1.2;
             font-size: 10px;
-        }}
+        }
 
-        .criteria-row {{
+        .criteria-row {
             display: grid;
             gap: 1px;
             padding: 12px 16px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.05);
+            border-bottom: 1px solid var(--white-5);
             align-items: center;
             cursor: pointer;
-            transition: background 0.2s ease;
-        }}
+            /* Off-screen rows skip style/layout/paint until scrolled to.
+               Rows are width: auto, so only a placeholder height is needed. */
+            content-visibility: auto;
+            contain-intrinsic-block-size: auto 56px;
+        }
+
+        .criteria-row:hover {
+            background: var(--white-3);
+        }
 
-        .criteria-row:hover {{
-            background: rgba(255, 255, 255, 0.03);
-        }}
+        /* Only pointers that can hover animate the row highlight */
+        @media (hover: hover) {
+            .criteria-row {
+                transition: background-color 120ms linear;
+            }
+        }
 
-        .criteria-name {{
+        .criteria-name {
             font-size: 11px;
             display: flex;
             align-items: center;
             gap: 8px;
             padding-right: 8px;
-        }}
+        }
 
-        .priority-badge {{
+        .priority-badge {
             display: inline-flex;
             align-items: center;
             justify-content: center;
@@ -2486,30 +2531,30 @@ def generate_html(
             border-radius: 4px;
             font-size: 11px;
             font-weight: 700;
-        }}
+        }
 
-        .priority-badge.must {{
+        .priority-badge.must {
             background: rgba(239, 68, 68, 0.2);
-            color: #ef4444;
-        }}
+            color: var(--red);
+        }
 
-        .priority-badge.should {{
+        .priority-badge.should {
             background: rgba(245, 158, 11, 0.2);
-            color: #f59e0b;
-        }}
+            color: var(--amber);
+        }
 
-        .priority-badge.could {{
+        .priority-badge.could {
             background: var(--accent-bg);
             color: var(--accent-text);
-        }}
+        }
 
-        .score-cell {{
+        .score-cell {
             display: flex;
             justify-content: center;
             align-items: center;
-        }}
+        }
 
-        .score {{
+        .score {
             display: inline-flex;
             align-items: center;
             justify-content: center;
@@ -2518,416 +2563,372 @@ def generate_html(
             border-radius: 5px;
             font-size: 11px;
             font-weight: 700;
-        }}
+        }
 
-        .score.s5 {{
+        .score.s5 {
             background: rgba(16, 185, 129, 0.2);
-            color: #10b981;
-        }}
+            color: var(--green);
+        }
 
-        .score.s4, .score.s4-5 {{
+        .score.s4 {
             background: rgba(250, 204, 21, 0.2);
             color: #fbbf24;
-        }}
+        }
 
-        .score.s3, .score.s3-5 {{
+        .score.s3 {
             background: rgba(245, 158, 11, 0.2);
-            color: #f59e0b;
-        }}
+            color: var(--amber);
+        }
 
-        .score.s2, .score.s2-5 {{
+        .score.s2 {
             background: rgba(249, 115, 22, 0.2);
             color: #f97316;
-        }}
+        }
 
-        .score.s1, .score.s1-5 {{
+        .score.s1 {
             background: rgba(239, 68, 68, 0.2);
-            color: #ef4444;
-        }}
+            color: var(--red);
+        }
 
-        .expand-details {{
+        .expand-details {
             display: none;
             grid-column: 1 / -1;
             padding: 16px;
             background: rgba(255, 255, 255, 0.02);
             border-radius: var(--radius-inner);
             margin-top: 12px;
-        }}
+        }
 
-        .expand-details.active {{
+        .expand-details.active {
             display: block;
-        }}
+        }
 
-        .expand-details h4 {{
+        .expand-details h4 {
             font-size: 14px;
             margin-bottom: 8px;
             color: var(--accent-text);
-        }}
+        }
 
-        .expand-details p {{
+        .expand-details p {
             font-size: 13px;
             color: var(--muted);
             line-height: 1.6;
-        }}
+        }
 
-        .summary-section {{
+        .summary-section {
             background: var(--card-bg);
             border: 1px solid var(--border);
             border-radius: var(--radius-card);
             padding: 32px;
             margin-bottom: 32px;
-        }}
+        }
 
-        .summary-title {{
+        .summary-title {
             font-size: 24px;
             font-weight: 700;
             margin-bottom: 24px;
             color: var(--accent-text);
-        }}
+        }
 
-        .summary-grid {{
+        .summary-grid {
             display: grid;
             grid-template-columns: repeat(3, 1fr);
             gap: 16px;
-        }}
+        }
 
-        .summary-card {{
-            background: rgba(255, 255, 255, 0.03);
+        .summary-card {
+            background: var(--white-3);
             border-radius: var(--radius-card);
             padding: 12px;
             text-align: center;
-        }}
+        }
 
-        .summary-card h5 {{
+        .summary-card h5 {
             font-size: 11px;
             color: var(--muted);
             margin-bottom: 6px;
             font-weight: 600;
-        }}
+        }
 
-        .summary-card .value {{
+        .summary-card .value {
             font-size: 20px;
             font-weight: 700;
-            color: #10b981;
-        }}
+            color: var(--green);
+        }
 
-        .final-scores {{
+        .final-scores {
             display: flex;
             flex-direction: column;
             gap: 20px;
             margin-bottom: 32px;
-        }}
-        .fs-row {{
+        }
+        .fs-row {
             display: grid;
             gap: 20px;
-        }}
-        .fs-row-2 {{ grid-template-columns: repeat(2, 1fr); }}
-        .fs-row-3 {{ grid-template-columns: repeat(3, 1fr); }}
-        .fs-row-4 {{ grid-template-columns: repeat(4, 1fr); }}
+        }
+        .fs-row-3 { grid-template-columns: repeat(3, 1fr); }
 
-        .provider-score-card {{
+        .provider-score-card {
             background: var(--card-bg);
             border: 1px solid var(--border);
             border-radius: var(--radius-card);
             padding: 24px;
             text-align: center;
-        }}
+            contain: layout paint style;
+        }
 
-        .provider-score-card:hover {{
-            background: rgba(255, 255, 255, 0.05);
+        .provider-score-card:hover {
+            background: var(--white-5);
             border-color: rgba(255, 255, 255, 0.2);
-        }}
+        }
 
-        .provider-score-card.top {{
+        .provider-score-card.top {
             border-width: 2px;
-        }}
+        }
 
-        .provider-score-card.top-1 {{
+        .provider-score-card.top-1 {
             border-color: #ffd700;
-            background: linear-gradient(135deg, rgba(255, 215, 0, 0.1) 0%, rgba(255, 255, 255, 0.03) 100%);
-        }}
+            background: linear-gradient(135deg, rgba(255, 215, 0, 0.1) 0%, var(--white-3) 100%);
+        }
 
-        .provider-score-card.top-2 {{
+        .provider-score-card.top-2 {
             border-color: #c0c0c0;
-            background: linear-gradient(135deg, rgba(192, 192, 192, 0.1) 0%, rgba(255, 255, 255, 0.03) 100%);
-        }}
+            background: linear-gradient(135deg, rgba(192, 192, 192, 0.1) 0%, var(--white-3) 100%);
+        }
 
-        .provider-score-card.top-3 {{
+        .provider-score-card.top-3 {
             border-color: #cd7f32;
-            background: linear-gradient(135deg, rgba(205, 127, 50, 0.1) 0%, rgba(255, 255, 255, 0.03) 100%);
-        }}
+            background: linear-gradient(135deg, rgba(205, 127, 50, 0.1) 0%, var(--white-3) 100%);
+        }
 
-        .rank-badge {{
+        .rank-badge {
             font-size: 14px;
             font-weight: 700;
             margin-bottom: 8px;
-        }}
+        }
 
-        .provider-score-card .tco {{
+        .provider-score-card .tco {
             font-size: 11px;
             color: var(--muted);
             margin-bottom: 8px;
-        }}
+        }
 
-        .provider-score-card h4 {{
+        .provider-score-card h4 {
             font-size: 14px;
             font-weight: 600;
             margin-bottom: 12px;
-        }}
+        }
 
-        .provider-score-card .score-value {{
+        .provider-score-card .score-value {
             font-size: 36px;
             font-weight: 800;
-            color: #10b981;
+            color: var(--green);
             margin-bottom: 4px;
-        }}
+        }
 
-        .provider-score-card.top .score-value {{
+        .provider-score-card.top .score-value {
             font-size: 42px;
-        }}
+        }
 
-        .provider-score-card.top-1 .score-value {{
+        .provider-score-card.top-1 .score-value {
             color: #ffd700;
-        }}
+        }
 
-        .provider-score-card.top-2 .score-value {{
+        .provider-score-card.top-2 .score-value {
             color: #c0c0c0;
-        }}
+        }
 
-        .provider-score-card.top-3 .score-value {{
+        .provider-score-card.top-3 .score-value {
             color: #cd7f32;
-        }}
+        }
 
-        .score-label {{
+        .score-label {
             font-size: 11px;
             color: var(--muted);
             margin-bottom: 16px;
-        }}
+        }
 
-        .breakdown {{
+        .breakdown {
             text-align: left;
             padding-top: 16px;
-            border-top: 1px solid rgba(255, 255, 255, 0.1);
-        }}
+            border-top: 1px solid var(--white-10);
+        }
 
-        .breakdown-item {{
+        .breakdown-item {
             display: flex;
             align-items: center;
             gap: 8px;
             margin-bottom: 8px;
-        }}
+        }
 
-        .breakdown-label {{
+        .breakdown-label {
             font-size: 10px;
             color: var(--muted);
             width: 50px;
-        }}
+        }
 
-        .breakdown-bar {{
+        .breakdown-bar {
             flex: 1;
             height: 6px;
-            background: rgba(255, 255, 255, 0.1);
+            background: var(--white-10);
             border-radius: 3px;
             overflow: hidden;
-        }}
+        }
 
-        .breakdown-fill {{
+        .breakdown-fill {
             height: 100%;
             border-radius: 3px;
-            transition: width 0.3s ease;
-        }}
+        }
 
-        .breakdown-fill.copilot {{ background: var(--accent-text); }}
-        .breakdown-fill.acw {{ background: #8b5cf6; }}
-        .breakdown-fill.analytics {{ background: #10b981; }}
-        .breakdown-fill.precall {{ background: #f59e0b; }}
-        .breakdown-fill.it {{ background: #ef4444; }}
-        .breakdown-fill.business {{ background: #ec4899; }}
+        .breakdown-fill.copilot { background: var(--accent-text); }
+        .breakdown-fill.acw { background: #8b5cf6; }
+        .breakdown-fill.analytics { background: var(--green); }
+        .breakdown-fill.precall { background: var(--amber); }
+        .breakdown-fill.it { background: var(--red); }
+        .breakdown-fill.business { background: #ec4899; }
 
-        .breakdown-value {{
+        .breakdown-value {
             font-size: 10px;
             color: #e0e6ed;
             width: 35px;
             text-align: right;
-        }}
-
-        @media (max-width: 1024px) {{
-            .fs-row-4 {{ grid-template-columns: repeat(2, 1fr); }}
-            .fs-row-3 {{ grid-template-columns: repeat(3, 1fr); }}
-        }}
-
-        @media (max-width: 700px) {{
-            .fs-row-3, .fs-row-4 {{ grid-template-columns: repeat(2, 1fr); }}
-        }}
-
-        .mth-card {{ background: var(--card-bg); border: 1px solid var(--border2); border-radius: var(--radius-card); padding: 32px; margin-top: 32px; }}
-        .mth-card-title {{ font-size: 20px; font-weight: 700; color: var(--accent-text); margin-bottom: 24px; }}
-        .mth-inner-divider {{ height: 1px; background: var(--border2); margin: 24px 0; }}
-        .mth-sub-label {{ font-size: 11px; font-weight: 600; color: var(--muted); letter-spacing: 1.2px; text-transform: uppercase; margin-bottom: 14px; }}
-        .msc-row {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 12px; }}
-        .msc-item {{ background: var(--bg2); border: 1px solid var(--border2); border-radius: 10px; padding: 14px 16px; display: flex; gap: 12px; align-items: flex-start; }}
-        .msc-icon {{ width: 32px; height: 32px; border-radius: 7px; display: flex; align-items: center; justify-content: center; font-size: 14px; font-weight: 800; flex-shrink: 0; }}
-        .msc-item.must .msc-icon   {{ background: rgba(239,68,68,0.15);  color: #ef4444; }}
-        .msc-item.should .msc-icon {{ background: rgba(251,146,60,0.15); color: #fb923c; }}
-        .msc-item.could .msc-icon  {{ background: rgba(56,189,248,0.15); color: #38bdf8; }}
-        .msc-top {{ display: flex; align-items: center; gap: 8px; margin-bottom: 4px; }}
-        .msc-name {{ font-size: 13px; font-weight: 700; }}
-        .msc-item.must .msc-name   {{ color: #ef4444; }}
-        .msc-item.should .msc-name {{ color: #fb923c; }}
-        .msc-item.could .msc-name  {{ color: #38bdf8; }}
-        .msc-badge {{ font-size: 9px; font-weight: 600; letter-spacing: 0.8px; text-transform: uppercase; padding: 1px 6px; border-radius: 3px; }}
-        .msc-item.must .msc-badge   {{ background: rgba(239,68,68,0.12);  color: #ef4444; }}
-        .msc-item.should .msc-badge {{ background: rgba(251,146,60,0.12); color: #fb923c; }}
-        .msc-item.could .msc-badge  {{ background: rgba(56,189,248,0.12); color: #38bdf8; }}
-        .msc-desc {{ font-size: 12px; color: var(--muted); line-height: 1.55; }}
-        .wf-row {{ display: grid; grid-template-columns: 1fr 1fr; gap: 12px; }}
-        .pb-list {{ display: flex; flex-direction: column; gap: 10px; justify-content: center; height: 100%; }}
-        .pb-row  {{ display: grid; grid-template-columns: 90px 1fr 52px; align-items: center; gap: 10px; }}
-        .pb-name {{ font-size: 12px; color: var(--muted); white-space: nowrap; }}
-        .pb-track {{ height: 5px; background: var(--border2); border-radius: 99px; overflow: hidden; }}
-        .pb-fill  {{ height: 100%; border-radius: 99px; }}
-        .pb-val   {{ font-size: 12px; font-weight: 700; text-align: right; white-space: nowrap; }}
-        .c-must   {{ color: #ef4444; }} .c-should {{ color: #fb923c; }}
-        .c-could  {{ color: #38bdf8; }} .c-total  {{ color: #7a8fa8; }}
-        .fill-must   {{ background: #ef4444; }}
-        .fill-should {{ background: #fb923c; }}
-        .fill-could  {{ background: #38bdf8; }}
-        .fill-total  {{ background: linear-gradient(90deg,#ef4444 0%,#fb923c 50%,#38bdf8 100%); }}
-        .formula-box {{ background: var(--bg2); border: 1px solid var(--border2); border-radius: 10px; padding: 16px; display: flex; align-items: center; justify-content: center; height: 100%; }}
-        .formula-math {{ display: inline-flex; align-items: center; justify-content: center; gap: 6px; flex-wrap: wrap; }}
-        .fm-lhs   {{ font-size: 13px; font-weight: 500; color: #8a9bb5; white-space: nowrap; }}
-        .fm-eq    {{ font-size: 16px; color: #3a526e; }}
-        .fm-sigma {{ font-size: 26px; color: #8a9bb5; font-weight: 300; line-height: 1; }}
-        .fm-paren {{ font-size: 34px; color: #3a526e; font-weight: 200; line-height: 1; }}
-        .fm-frac  {{ display: inline-flex; flex-direction: column; align-items: center; margin: 0 2px; }}
-        .fm-num   {{ font-size: 11px; color: var(--muted); white-space: nowrap; padding-bottom: 3px; }}
-        .fm-line  {{ width: 100%; height: 1px; background: #364d66; }}
-        .fm-den   {{ font-size: 18px; font-weight: 700; color: #e2e8f0; padding-top: 3px; }}
-        .fm-op    {{ font-size: 14px; color: #3a526e; }}
-        .fm-param {{ font-size: 13px; font-weight: 500; color: #8a9bb5; white-space: nowrap; }}
-        .fm-x100  {{ font-size: 18px; font-weight: 700; color: #e2e8f0; }}
-        .scale-row {{ display: grid; grid-template-columns: repeat(5, 1fr); gap: 10px; }}
-        .sg {{ --sc: #22c55e; }} .sl2 {{ --sc: #84cc16; }} .sy {{ --sc: #eab308; }}
-        .so {{ --sc: #f97316; }} .srd {{ --sc: #ef4444; }}
-        .scale-item {{ background: var(--bg2); border: 1px solid var(--border2); border-left: 3px solid var(--sc); border-radius: 8px; padding: 12px; display: flex; gap: 10px; align-items: flex-start; }}
-        .scale-score {{ font-size: 26px; font-weight: 800; color: var(--sc); line-height: 1; flex-shrink: 0; }}
-        .scale-name {{ font-size: 11px; font-weight: 700; color: var(--sc); margin-bottom: 4px; }}
-        .scale-track {{ height: 3px; background: var(--border2); border-radius: 99px; margin-bottom: 6px; overflow: hidden; }}
-        .scale-fill  {{ height: 100%; border-radius: 99px; background: var(--sc); }}
-        .scale-desc  {{ font-size: 11px; color: var(--muted); line-height: 1.45; }}
-        @media (max-width: 960px) {{ .msc-row, .wf-row {{ grid-template-columns: 1fr; }} .scale-row {{ grid-template-columns: repeat(2,1fr); }} }}
-
-        @media (max-width: 1200px) {{
-            .final-scores {{
+        }
+
+        @media (max-width: 700px) {
+            .fs-row-3 { grid-template-columns: repeat(2, 1fr); }
+        }
+
+        .mth-card { background: var(--card-bg); border: 1px solid var(--border2); border-radius: var(--radius-card); padding: 32px; margin-top: 32px; }
+        .mth-card-title { font-size: 20px; font-weight: 700; color: var(--accent-text); margin-bottom: 24px; }
+        .mth-inner-divider { height: 1px; background: var(--border2); margin: 24px 0; }
+        .mth-sub-label { font-size: 11px; font-weight: 600; color: var(--muted); letter-spacing: 1.2px; text-transform: uppercase; margin-bottom: 14px; }
+        .msc-row { display: grid; grid-template-columns: repeat(3, 1fr); gap: 12px; }
+        .msc-item { background: var(--bg2); border: 1px solid var(--border2); border-radius: 10px; padding: 14px 16px; display: flex; gap: 12px; align-items: flex-start; }
+        .msc-icon { width: 32px; height: 32px; border-radius: 7px; display: flex; align-items: center; justify-content: center; font-size: 14px; font-weight: 800; flex-shrink: 0; }
+        .msc-item.must .msc-icon   { background: rgba(239,68,68,0.15);  color: var(--red); }
+        .msc-item.should .msc-icon { background: rgba(251,146,60,0.15); color: #fb923c; }
+        .msc-item.could .msc-icon  { background: rgba(56,189,248,0.15); color: #38bdf8; }
+        .msc-top { display: flex; align-items: center; gap: 8px; margin-bottom: 4px; }
+        .msc-name { font-size: 13px; font-weight: 700; }
+        .msc-item.must .msc-name   { color: var(--red); }
+        .msc-item.should .msc-name { color: #fb923c; }
+        .msc-item.could .msc-name  { color: #38bdf8; }
+        .msc-badge { font-size: 9px; font-weight: 600; letter-spacing: 0.8px; text-transform: uppercase; padding: 1px 6px; border-radius: 3px; }
+        .msc-item.must .msc-badge   { background: rgba(239,68,68,0.12);  color: var(--red); }
+        .msc-item.should .msc-badge { background: rgba(251,146,60,0.12); color: #fb923c; }
+        .msc-item.could .msc-badge  { background: rgba(56,189,248,0.12); color: #38bdf8; }
+        .msc-desc { font-size: 12px; color: var(--muted); line-height: 1.55; }
+        .wf-row { display: grid; grid-template-columns: 1fr 1fr; gap: 12px; }
+        .pb-list { display: flex; flex-direction: column; gap: 10px; justify-content: center; height: 100%; }
+        .pb-row  { display: grid; grid-template-columns: 90px 1fr 52px; align-items: center; gap: 10px; }
+        .pb-name { font-size: 12px; color: var(--muted); white-space: nowrap; }
+        .pb-track { height: 5px; background: var(--border2); border-radius: 99px; overflow: hidden; }
+        .pb-fill  { height: 100%; border-radius: 99px; }
+        .pb-val   { font-size: 12px; font-weight: 700; text-align: right; white-space: nowrap; }
+        .c-must   { color: var(--red); } .c-should { color: #fb923c; }
+        .c-could  { color: #38bdf8; } .c-total  { color: #7a8fa8; }
+        .fill-must   { background: var(--red); }
+        .fill-should { background: #fb923c; }
+        .fill-could  { background: #38bdf8; }
+        .fill-total  { background: linear-gradient(90deg,var(--red) 0%,#fb923c 50%,#38bdf8 100%); }
+        .formula-box { background: var(--bg2); border: 1px solid var(--border2); border-radius: 10px; padding: 16px; display: flex; align-items: center; justify-content: center; height: 100%; }
+        .formula-math { display: inline-flex; align-items: center; justify-content: center; gap: 6px; flex-wrap: wrap; }
+        .fm-lhs   { font-size: 13px; font-weight: 500; color: #8a9bb5; white-space: nowrap; }
+        .fm-eq    { font-size: 16px; color: #3a526e; }
+        .fm-sigma { font-size: 26px; color: #8a9bb5; font-weight: 300; line-height: 1; }
+        .fm-paren { font-size: 34px; color: #3a526e; font-weight: 200; line-height: 1; }
+        .fm-frac  { display: inline-flex; flex-direction: column; align-items: center; margin: 0 2px; }
+        .fm-num   { font-size: 11px; color: var(--muted); white-space: nowrap; padding-bottom: 3px; }
+        .fm-line  { width: 100%; height: 1px; background: #364d66; }
+        .fm-den   { font-size: 18px; font-weight: 700; color: #e2e8f0; padding-top: 3px; }
+        .fm-op    { font-size: 14px; color: #3a526e; }
+        .fm-param { font-size: 13px; font-weight: 500; color: #8a9bb5; white-space: nowrap; }
+        .fm-x100  { font-size: 18px; font-weight: 700; color: #e2e8f0; }
+        .scale-row { display: grid; grid-template-columns: repeat(5, 1fr); gap: 10px; }
+        .sg { --sc: #22c55e; } .sl2 { --sc: #84cc16; } .sy { --sc: #eab308; }
+        .so { --sc: #f97316; } .srd { --sc: var(--red); }
+        .scale-item { background: var(--bg2); border: 1px solid var(--border2); border-left: 3px solid var(--sc); border-radius: 8px; padding: 12px; display: flex; gap: 10px; align-items: flex-start; }
+        .scale-score { font-size: 26px; font-weight: 800; color: var(--sc); line-height: 1; flex-shrink: 0; }
+        .scale-name { font-size: 11px; font-weight: 700; color: var(--sc); margin-bottom: 4px; }
+        .scale-track { height: 3px; background: var(--border2); border-radius: 99px; margin-bottom: 6px; overflow: hidden; }
+        .scale-fill  { height: 100%; border-radius: 99px; background: var(--sc); }
+        .scale-desc  { font-size: 11px; color: var(--muted); line-height: 1.45; }
+        @media (max-width: 960px) { .msc-row, .wf-row { grid-template-columns: 1fr; } .scale-row { grid-template-columns: repeat(2,1fr); } }
+
+        @media (max-width: 1200px) {
+            .final-scores {
                 grid-template-columns: repeat(4, 1fr);
-            }}
-            .summary-grid {{
+            }
+            .summary-grid {
                 grid-template-columns: repeat(3, 1fr);
-            }}
-        }}
+            }
+        }
 
         /* Recommendations Tab Styles */
-        .recommendations-section {{
+        .recommendations-section {
             margin: 0 auto;
-        }}
+        }
 
-        .rec-header {{
+        .rec-header {
             margin-bottom: 40px;
-        }}
+        }
 
-        .rec-eyebrow {{
+        .rec-eyebrow {
             font-size: 11px;
             letter-spacing: 0.18em;
             text-transform: uppercase;
-            color: #10b981;
+            color: var(--green);
             margin-bottom: 16px;
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
 
-        .rec-eyebrow::before {{
+        .rec-eyebrow::before {
             content: '';
             display: inline-block;
             width: 24px;
             height: 1px;
-            background: #10b981;
+            background: var(--green);
             opacity: 0.6;
-        }}
+        }
 
-        .rec-title {{
+        .rec-title {
             font-size: 32px;
             font-weight: 700;
             line-height: 1.2;
             margin-bottom: 16px;
-        }}
-
-        .rec-title .highlight {{
-            color: #10b981;
-        }}
+        }
 
-        .rec-lead {{
+        .rec-lead {
             font-size: 15px;
             color: var(--muted);
             line-height: 1.7;
             max-width: 680px;
-        }}
+        }
 
-        .rec-divider {{
+        .rec-divider {
             display: flex;
             align-items: center;
             gap: 12px;
             margin: 40px 0 24px;
-        }}
+        }
 
-        .rec-divider-label {{
+        .rec-divider-label {
             font-size: 10px;
             letter-spacing: 0.16em;
             text-transform: uppercase;
             color: var(--muted);
             white-space: nowrap;
-        }}
+        }
 
-        .rec-divider-line {{
+        .rec-divider-line {
             flex: 1;
             height: 1px;
-            background: rgba(255, 255, 255, 0.1);
-        }}
-
-        .alert-box {{
-            border-radius: var(--radius-card);
-            padding: 20px 24px;
-            margin-bottom: 16px;
-            display: flex;
-            gap: 16px;
-            align-items: flex-start;
-        }}
-
-        .alert-red {{
-            background: rgba(239, 68, 68, 0.1);
-            border: 1px solid rgba(239, 68, 68, 0.25);
-        }}
-
-        .alert-icon {{
-            font-size: 18px;
-            flex-shrink: 0;
-        }}
-
-        .alert-title {{
-            font-size: 12px;
-            font-weight: 600;
-            letter-spacing: 0.05em;
-            margin-bottom: 8px;
-            color: #ef4444;
-        }}
-
-        .alert-text {{
-            font-size: 14px;
-            line-height: 1.65;
-            color: #d1a0a0;
-        }}
+            background: var(--white-10);
+        }
 
-        .strategy-alert-card {{
+        .strategy-alert-card {
             background: var(--card-bg);
             border: 1px solid var(--border);
             border-radius: var(--radius-card);
@@ -2935,9 +2936,9 @@ def generate_html(
             margin-bottom: 20px;
             position: relative;
             overflow: hidden;
-        }}
+        }
 
-        .strategy-alert-card::before {{
+        .strategy-alert-card::before {
             content: '';
             position: absolute;
             top: 0;
@@ -2946,9 +2947,9 @@ def generate_html(
             height: 2px;
             background: #e97451;
             opacity: 0.5;
-        }}
+        }
 
-        .strategy-card {{
+        .strategy-card {
             background: var(--card-bg);
             border: 1px solid var(--border);
             border-radius: var(--radius-card);
@@ -2956,358 +2957,175 @@ def generate_html(
             margin-bottom: 20px;
             position: relative;
             overflow: hidden;
-        }}
+            contain: layout paint style;
+        }
 
-        .strategy-card::before {{
+        .strategy-card::before {
             content: '';
             position: absolute;
             top: 0;
             left: 0;
             right: 0;
             height: 2px;
-            background: #10b981;
+            background: var(--green);
             opacity: 0.5;
-        }}
+        }
 
-        .strategy-label {{
+        .strategy-label {
             font-size: 10px;
             letter-spacing: 0.12em;
             text-transform: uppercase;
-            color: #10b981;
+            color: var(--green);
             margin-bottom: 10px;
-        }}
+        }
 
-        .strategy-title {{
+        .strategy-title {
             font-size: 18px;
             font-weight: 700;
             margin-bottom: 12px;
-        }}
+        }
 
-        .strategy-text {{
+        .strategy-text {
             font-size: 14px;
             color: var(--muted);
             line-height: 1.7;
-        }}
-
-        .components-grid {{
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 16px;
-            margin: 20px 0;
-        }}
-
-        .component-card {{
-            background: rgba(255, 255, 255, 0.02);
-            border: 1px solid var(--border);
-            border-radius: var(--radius-card);
-            padding: 20px;
-        }}
-
-        .component-num {{
-            font-size: 11px;
-            font-weight: 700;
-            color: var(--muted);
-            margin-bottom: 10px;
-            letter-spacing: 0.08em;
-        }}
-
-        .component-tag {{
-            display: inline-block;
-            font-size: 9px;
-            font-weight: 600;
-            padding: 4px 8px;
-            border-radius: 4px;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-            margin-bottom: 10px;
-        }}
-
-        .tag-logic {{
-            background: rgba(16, 185, 129, 0.15);
-            color: #10b981;
-            border: 1px solid rgba(16, 185, 129, 0.25);
-        }}
-
-        .tag-voice {{
-            background: var(--accent-bg);
-            color: var(--accent-text);
-            border: 1px solid var(--accent-b);
-        }}
-
-        .tag-api {{
-            background: rgba(245, 158, 11, 0.1);
-            color: #f59e0b;
-            border: 1px solid rgba(245, 158, 11, 0.25);
-        }}
-
-        .component-name {{
-            font-size: 14px;
-            font-weight: 700;
-            margin-bottom: 8px;
-        }}
-
-        .component-desc {{
-            font-size: 12px;
-            color: var(--muted);
-            line-height: 1.5;
-        }}
-
-        .roadmap {{
-            position: relative;
-            padding-left: 32px;
-        }}
-
-        .roadmap::before {{
-            content: '';
-            position: absolute;
-            left: 11px;
-            top: 20px;
-            bottom: 20px;
-            width: 1px;
-            background: rgba(255, 255, 255, 0.1);
-        }}
-
-        .roadmap-item {{
-            position: relative;
-            margin-bottom: 20px;
-        }}
-
-        .roadmap-item:last-child {{
-            margin-bottom: 0;
-        }}
-
-        .roadmap-dot {{
-            position: absolute;
-            left: -26px;
-            top: 20px;
-            width: 14px;
-            height: 14px;
-            border-radius: 50%;
-            background: #1a1f3a;
-            border: 2px solid #10b981;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-
-        .roadmap-dot-inner {{
-            width: 5px;
-            height: 5px;
-            border-radius: 50%;
-            background: #10b981;
-        }}
-
-        .roadmap-card {{
-            background: var(--card-bg);
-            border: 1px solid var(--border);
-            border-radius: var(--radius-card);
-            padding: 20px 24px;
-        }}
-
-        .roadmap-step {{
-            font-size: 9px;
-            font-weight: 600;
-            letter-spacing: 0.1em;
-            text-transform: uppercase;
-            color: var(--muted);
-            background: rgba(255, 255, 255, 0.05);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            padding: 4px 10px;
-            border-radius: 4px;
-            display: inline-block;
-            margin-bottom: 12px;
-        }}
-
-        .roadmap-title {{
-            font-size: 16px;
-            font-weight: 700;
-            margin-bottom: 16px;
-        }}
-
-        .roadmap-row {{
-            display: flex;
-            align-items: flex-start;
-            gap: 12px;
-            margin-bottom: 12px;
-            padding-bottom: 12px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.05);
-        }}
-
-        .roadmap-row:last-child {{
-            margin-bottom: 0;
-            padding-bottom: 0;
-            border-bottom: none;
-        }}
-
-        .roadmap-label {{
-            font-size: 10px;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-            white-space: nowrap;
-            padding-top: 2px;
-            min-width: 60px;
-        }}
+        }
 
-        .label-goal {{
-            color: #10b981;
-        }}
+        @media (max-width: 768px) {
+            h1 {
+                font-size: 32px;
+            }
+            .tabs {
+                flex-wrap: wrap;
+            }
+            .summary-grid {
+                grid-template-columns: repeat(2, 1fr);
+            }
+        }
 
-        .label-action {{
-            color: #f59e0b;
-        }}
+        .panel{display:none;padding:0 0 80px}
 
-        .label-result {{
-            color: var(--accent-text);
-        }}
+        .hero{padding:24px 32px 20px;border-bottom:1px solid var(--border);
+          display:flex;align-items:flex-end;justify-content:space-between;gap:16px}
+        .hero h2{font-size:20px;font-weight:700;line-height:1.15}
+        .hero p{font-size:11px;color:var(--muted);margin-top:4px;line-height:1.6;max-width:600px}
+        .chips{display:flex;gap:6px;flex-wrap:wrap;align-items:flex-start}
+        .chip{font-family:'JetBrains Mono',monospace;font-size:8px;font-weight:500;
+          padding:3px 8px;border-radius:20px;border:1px solid;letter-spacing:.04em;white-space:nowrap}
 
-        .roadmap-text {{
-            font-size: 13px;
-            color: var(--muted);
-            line-height: 1.55;
-        }}
+        .sl{font-family:'JetBrains Mono',monospace;font-size:8px;font-weight:500;
+          letter-spacing:.16em;text-transform:uppercase;color:var(--muted);
+          padding:20px 32px 8px;display:flex;align-items:center;gap:10px}
+        .sl::before{content:'//';color:var(--ai);opacity:.6}
+        .sl::after{content:'';flex:1;height:1px;background:var(--border)}
 
-        .benefits-list {{
-            display: flex;
-            flex-direction: column;
-            gap: 12px;
-        }}
+        .diag-wrap{width:100vw;position:relative;left:50%;right:50%;margin-left:-50vw;margin-right:-50vw;
+          border-top:1px solid var(--border2);border-bottom:1px solid var(--border2);border-radius:0;
+          overflow-x:auto;background:#0b0e14}
+        .diag-wrap:active{cursor:grabbing}
+        .diag-wrap svg{display:block}
+
+        .legend{display:flex;gap:18px;padding:8px 32px 0;flex-wrap:wrap;align-items:center}
+        .leg{display:flex;align-items:center;gap:6px;
+          font-family:'JetBrains Mono',monospace;font-size:8.5px;color:var(--muted)}
+
+        .pg{display:grid;grid-template-columns:repeat(3,1fr);gap:10px;margin:0 32px}
+        .pg.pg4{grid-template-columns:repeat(4,1fr)}
+        .pgc{border-radius:6px;padding:12px 14px;border:1px solid}
+        .pgc.g{background:var(--ai-bg);border-color:var(--ai-b)}
+        .pgc-t{font-size:11px;font-weight:700;margin-bottom:4px}
+        .pgc.g .pgc-t{color:var(--ai)}
+        .pgc-d{font-size:10.5px;line-height:1.65;color:#a0b0c8}
 
-        .benefit-item {{
-            display: flex;
-            align-items: flex-start;
-            gap: 14px;
-            background: var(--card-bg);
-            border: 1px solid var(--border);
-            border-radius: var(--radius-inner);
-            padding: 16px 20px;
-        }}
+        /* ── AS-IS / TO-BE tab styles ── */
+        .bpmn-wrap{width:100vw;position:relative;left:50%;right:50%;margin-left:-50vw;margin-right:-50vw;
+          border-top:1px solid var(--border2);border-bottom:1px solid var(--border2);overflow-x:auto;background:var(--bg)}
+        .bpmn-wrap svg{display:block;width:100%;height:auto}
+        .page-header{padding:24px 32px 0}
+        .page-title{font-size:20px;font-weight:700;color:var(--text);margin-bottom:6px;letter-spacing:-0.01em}
+        .page-sub{font-size:12px;color:var(--muted);letter-spacing:0.01em}
+        #p-as .legend,#p-to .legend{gap:8px;padding:12px 32px;margin:0}
+        #p-as .leg,#p-to .leg{display:flex;align-items:center;gap:6px;font-size:11px;color:var(--muted);
+          padding:4px 10px;border:1px solid var(--border2);border-radius:3px;background:var(--bg);
+          font-family:-apple-system,sans-serif;font-weight:400;letter-spacing:0;text-transform:none}
+        .leg-dot{width:8px;height:8px;border-radius:1px;flex-shrink:0}
+        .section{padding:24px 32px;border-bottom:1px solid var(--border2)}
+        .sec-label{font-size:10px;font-weight:600;letter-spacing:0.2em;text-transform:uppercase;
+          color:var(--muted);margin-bottom:20px;display:flex;align-items:center;gap:8px}
+        .sec-label::before{content:'//';color:var(--accent-text);font-weight:400}
+        .prob-grid{display:grid;grid-template-columns:repeat(3,1fr);gap:12px}
+        .prob-card{background:var(--warn-bg);padding:20px 22px;border:1px solid var(--warn-b);border-radius:6px}
+        .prob-title{font-size:13px;font-weight:600;color:var(--warn);margin-bottom:8px}
+        .prob-text{font-size:12px;color:var(--muted);line-height:1.6}
+        .sys-table{border:1px solid var(--border2);border-radius:3px;overflow:hidden;background:var(--bg)}
+        .sys-head{display:grid;grid-template-columns:180px 1fr 1fr;background:var(--bg);border-bottom:2px solid var(--border2)}
+        .sh{padding:12px 18px;font-size:10px;font-weight:600;letter-spacing:0.15em;text-transform:uppercase;border-right:1px solid var(--border2)}
+        .sh:last-child{border-right:none}
+        .sh.cat{color:var(--muted)}
+        .sh.ua{color:var(--accent-text)}
+        .sh.eu{color:#e8a84a}
+        .sys-row{display:grid;grid-template-columns:180px 1fr 1fr;border-bottom:1px solid var(--border2)}
+        .sys-row:last-child{border-bottom:none}
+        .sc{padding:16px 18px;border-right:1px solid var(--border2);font-size:12px;color:var(--muted);line-height:1.6}
+        .sc:last-child{border-right:none}
+        .sc.cat{font-size:11px;font-weight:600;color:var(--muted);background:var(--bg)}
+        .sc.ua{border-left:2px solid var(--accent-b)}
+        .sc.eu{border-left:2px solid rgba(232,168,74,.5)}
+        .badge{display:inline-block;font-size:9px;font-weight:700;letter-spacing:0.1em;text-transform:uppercase;padding:2px 7px;border-radius:2px;margin-bottom:8px}
+        .b-ok{background:var(--ai-bg);color:var(--ai);border:1px solid var(--ai-b)}
+        .b-warn{background:var(--warn-bg);color:var(--warn);border:1px solid var(--warn-b)}
+        .b-bad{background:rgba(232,90,74,.08);color:#e85a4a;border:1px solid rgba(232,90,74,.2)}
+        .b-sys{background:var(--accent-bg);color:var(--accent-text);border:1px solid var(--accent-b)}
+        .b-ms{background:var(--accent-bg);color:var(--accent-text);border:1px solid var(--accent-b)}
+        ul.dl{list-style:none;padding:0;margin:0}
+        ul.dl li{padding-left:12px;position:relative;margin-bottom:4px;font-size:12px;color:var(--muted)}
+        ul.dl li::before{content:'·';position:absolute;left:0;color:#2a2f45}
+        ul.dl li.bad{color:var(--warn)}
+        ul.dl li.bad::before{content:'⚠';font-size:9px;top:2px;color:#e85a4a}
+        @media(max-width:700px){
+          .prob-grid{grid-template-columns:1fr}
+          .sys-head,.sys-row{grid-template-columns:120px 1fr}
+          .sh.eu,.sc.eu{display:none}
+        }
 
-        .benefit-icon {{
-            font-size: 16px;
-            flex-shrink: 0;
-        }}
+"""
 
-        .benefit-text {{
-            font-size: 14px;
-            color: var(--muted);
-            line-height: 1.55;
-        }}
+# Quoted strings are kept verbatim; comments are dropped; whitespace around
+# block/declaration punctuation and after ":" is removed; other runs collapse
+# to a single space.
+_CSS_MIN_RE = re.compile(
+    r"""('[^']*'|"[^"]*")|/\*.*?\*/\s*|\s*([{};,>])\s*|:\s+|\s+""", re.S
+)
 
-        .benefit-text strong {{
-            color: #e0e6ed;
-        }}
 
-        @media (max-width: 900px) {{
-            .components-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
 
-        @media (max-width: 768px) {{
-            h1 {{
-                font-size: 32px;
-            }}
-            .winner-score {{
-                font-size: 48px;
-            }}
-            .tabs {{
-                flex-wrap: wrap;
-            }}
-            .summary-grid {{
-                grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
+    def _sub(m: "re.Match[str]") -> str:
+        token = m.group(1) or m.group(2)
+        if token:
+            return token
+        text = m.group(0)
+        if text.startswith("/*"):
+            return ""
+        return ":" if text.startswith(":") else " "
 
-        .panel{{display:none;padding:0 0 80px}}
-        .panel.on{{display:block}}
+    return _CSS_MIN_RE.sub(_sub, css).replace(";}", "}").strip()
 
-        .hero{{padding:24px 32px 20px;border-bottom:1px solid var(--border);
-          display:flex;align-items:flex-end;justify-content:space-between;gap:16px}}
-        .hero h2{{font-size:20px;font-weight:700;line-height:1.15}}
-        .hero p{{font-size:11px;color:var(--muted);margin-top:4px;line-height:1.6;max-width:600px}}
-        .chips{{display:flex;gap:6px;flex-wrap:wrap;align-items:flex-start}}
-        .chip{{font-family:'JetBrains Mono',monospace;font-size:8px;font-weight:500;
-          padding:3px 8px;border-radius:20px;border:1px solid;letter-spacing:.04em;white-space:nowrap}}
 
-        .sl{{font-family:'JetBrains Mono',monospace;font-size:8px;font-weight:500;
-          letter-spacing:.16em;text-transform:uppercase;color:var(--muted);
-          padding:20px 32px 8px;display:flex;align-items:center;gap:10px}}
-        .sl::before{{content:'//';color:var(--ai);opacity:.6}}
-        .sl::after{{content:'';flex:1;height:1px;background:var(--border)}}
+# What actually goes into <style>: _CSS minified once at import time.
+_CSS_MIN = _minify_css(_CSS) + "\n"
 
-        .diag-wrap{{width:100vw;position:relative;left:50%;right:50%;margin-left:-50vw;margin-right:-50vw;
-          border-top:1px solid var(--border2);border-bottom:1px solid var(--border2);border-radius:0;
-          overflow-x:auto;background:#0b0e14}}
-        .diag-wrap:active{{cursor:grabbing}}
-        .diag-wrap svg{{display:block}}
-
-        .legend{{display:flex;gap:18px;padding:8px 32px 0;flex-wrap:wrap;align-items:center}}
-        .leg{{display:flex;align-items:center;gap:6px;
-          font-family:'JetBrains Mono',monospace;font-size:8.5px;color:var(--muted)}}
-
-        .pg{{display:grid;grid-template-columns:repeat(3,1fr);gap:10px;margin:0 32px}}
-        .pg.pg4{{grid-template-columns:repeat(4,1fr)}}
-        .pgc{{border-radius:6px;padding:12px 14px;border:1px solid}}
-        .pgc.w{{background:var(--warn-bg);border-color:var(--warn-b)}}
-        .pgc.g{{background:var(--ai-bg);border-color:var(--ai-b)}}
-        .pgc-t{{font-size:11px;font-weight:700;margin-bottom:4px}}
-        .pgc.w .pgc-t{{color:var(--warn)}}
-        .pgc.g .pgc-t{{color:var(--ai)}}
-        .pgc-d{{font-size:10.5px;line-height:1.65;color:#a0b0c8}}
+# bpmn-js viewer assets; the BPMN data <script> is written right after them.
+_BPMN_ASSETS_HTML = (
+    '<link rel="stylesheet" href="https://unpkg.com/bpmn-js@17/dist/assets/diagram-js.css">\n'
+    '    <link rel="stylesheet" href="https://unpkg.com/bpmn-js@17/dist/assets/bpmn-font/css/bpmn.css">\n'
+    '    <script src="https://unpkg.com/bpmn-js@17/dist/bpmn-navigated-viewer.production.min.js"></script>\n'
+)
 
-        /* ── AS-IS / TO-BE tab styles ── */
-        .bpmn-wrap{{width:100vw;position:relative;left:50%;right:50%;margin-left:-50vw;margin-right:-50vw;
-          border-top:1px solid var(--border2);border-bottom:1px solid var(--border2);overflow-x:auto;background:var(--bg)}}
-        .bpmn-wrap svg{{display:block;width:100%;height:auto}}
-        .page-header{{padding:24px 32px 0}}
-        .page-title{{font-size:20px;font-weight:700;color:var(--text);margin-bottom:6px;letter-spacing:-0.01em}}
-        .page-sub{{font-size:12px;color:var(--muted);letter-spacing:0.01em}}
-        #p-as .legend,#p-to .legend{{gap:8px;padding:12px 32px;margin:0}}
-        #p-as .leg,#p-to .leg{{display:flex;align-items:center;gap:6px;font-size:11px;color:var(--muted);
-          padding:4px 10px;border:1px solid var(--border2);border-radius:3px;background:var(--bg);
-          font-family:-apple-system,sans-serif;font-weight:400;letter-spacing:0;text-transform:none}}
-        .leg-dot{{width:8px;height:8px;border-radius:1px;flex-shrink:0}}
-        .section{{padding:24px 32px;border-bottom:1px solid var(--border2)}}
-        .sec-label{{font-size:10px;font-weight:600;letter-spacing:0.2em;text-transform:uppercase;
-          color:var(--muted);margin-bottom:20px;display:flex;align-items:center;gap:8px}}
-        .sec-label::before{{content:'//';color:var(--accent-text);font-weight:400}}
-        .prob-grid{{display:grid;grid-template-columns:repeat(3,1fr);gap:12px}}
-        .prob-card{{background:var(--warn-bg);padding:20px 22px;border:1px solid var(--warn-b);border-radius:6px}}
-        .prob-title{{font-size:13px;font-weight:600;color:var(--warn);margin-bottom:8px}}
-        .prob-text{{font-size:12px;color:var(--muted);line-height:1.6}}
-        .sys-table{{border:1px solid var(--border2);border-radius:3px;overflow:hidden;background:var(--bg)}}
-        .sys-head{{display:grid;grid-template-columns:180px 1fr 1fr;background:var(--bg);border-bottom:2px solid var(--border2)}}
-        .sh{{padding:12px 18px;font-size:10px;font-weight:600;letter-spacing:0.15em;text-transform:uppercase;border-right:1px solid var(--border2)}}
-        .sh:last-child{{border-right:none}}
-        .sh.cat{{color:var(--muted)}}
-        .sh.ua{{color:var(--accent-text)}}
-        .sh.eu{{color:#e8a84a}}
-        .sys-row{{display:grid;grid-template-columns:180px 1fr 1fr;border-bottom:1px solid var(--border2)}}
-        .sys-row:last-child{{border-bottom:none}}
-        .sc{{padding:16px 18px;border-right:1px solid var(--border2);font-size:12px;color:var(--muted);line-height:1.6}}
-        .sc:last-child{{border-right:none}}
-        .sc.cat{{font-size:11px;font-weight:600;color:var(--muted);background:var(--bg)}}
-        .sc.ua{{border-left:2px solid var(--accent-b)}}
-        .sc.eu{{border-left:2px solid rgba(232,168,74,.5)}}
-        .badge{{display:inline-block;font-size:9px;font-weight:700;letter-spacing:0.1em;text-transform:uppercase;padding:2px 7px;border-radius:2px;margin-bottom:8px}}
-        .b-ok{{background:var(--ai-bg);color:var(--ai);border:1px solid var(--ai-b)}}
-        .b-warn{{background:var(--warn-bg);color:var(--warn);border:1px solid var(--warn-b)}}
-        .b-bad{{background:rgba(232,90,74,.08);color:#e85a4a;border:1px solid rgba(232,90,74,.2)}}
-        .b-sys{{background:var(--accent-bg);color:var(--accent-text);border:1px solid var(--accent-b)}}
-        .b-ms{{background:var(--accent-bg);color:var(--accent-text);border:1px solid var(--accent-b)}}
-        ul.dl{{list-style:none;padding:0;margin:0}}
-        ul.dl li{{padding-left:12px;position:relative;margin-bottom:4px;font-size:12px;color:var(--muted)}}
-        ul.dl li::before{{content:'·';position:absolute;left:0;color:#2a2f45}}
-        ul.dl li.bad{{color:var(--warn)}}
-        ul.dl li.bad::before{{content:'⚠';font-size:9px;top:2px;color:#e85a4a}}
-        @media(max-width:700px){{
-          .prob-grid{{grid-template-columns:1fr}}
-          .sys-head,.sys-row{{grid-template-columns:120px 1fr}}
-          .sh.eu,.sc.eu{{display:none}}
-        }}
-
-    </style>
-</head>
+# </head>, page header, tab bar and the start of the "overall" tab; the
+# ranked provider score cards are written right after it.
+_PAGE_TOP_HTML = """</head>
 <body>
     <div class="container">
         <header>
@@ -3361,7 +3179,11 @@ def generate_html(
                 <h3 class="summary-title">Підсумкові оцінки</h3>
                 <div class="final-scores">
 
-{provider_cards}
+"""
+
+# End of the score cards plus the static methodology block that closes the
+# "overall" tab; the category tabs follow.
+_METHODOLOGY_HTML = """
 
                 </div>
             </div>
@@ -3489,13 +3311,10 @@ def generate_html(
             </div>
         </div>
 
-{category_tabs}
-
-{generate_recommendations_tab(final_scores)}
-
-{generate_asis_tab()}
+"""
 
-{generate_tobe_tab()}
+# Closing container, tab-switching script and end of document.
+_SCRIPT_HTML = """
 
     </div>
 
@@ -3503,46 +3322,175 @@ def generate_html(
             const tabs = document.querySelectorAll('.tab');
             const contents = document.querySelectorAll('.tab-content');
 
-            tabs.forEach(tab => {{
-                tab.addEventListener('click', () => {{
+            tabs.forEach(tab => {
+                tab.addEventListener('click', () => {
                     const targetTab = tab.dataset.tab;
 
                     tabs.forEach(t => t.classList.remove('active'));
                     contents.forEach(c => c.classList.remove('active'));
 
                     tab.classList.add('active');
-                    document.querySelector(`[data-content="${{targetTab}}"]`).classList.add('active');
-                }});
-            }});
+                    document.querySelector(`[data-content="${targetTab}"]`).classList.add('active');
+                });
+            });
 
-            function toggleExpand(row) {{
+            function toggleExpand(row) {
                 const expandDetails = row.querySelector('.expand-details');
                 const allExpanded = document.querySelectorAll('.expand-details.active');
 
-                allExpanded.forEach(el => {{
-                    if (el !== expandDetails) {{
+                allExpanded.forEach(el => {
+                    if (el !== expandDetails) {
                         el.classList.remove('active');
-                    }}
-                }});
+                    }
+                });
 
-                if (expandDetails) {{
+                if (expandDetails) {
                     expandDetails.classList.toggle('active');
-                }}
-            }}
+                }
+            }
         </script>
 </body>
 </html>"""
 
-    # Inject bpmn-js CDN assets and BPMN data before </head>
-    _cdn = (
-        '<link rel="stylesheet" href="https://unpkg.com/bpmn-js@17/dist/assets/diagram-js.css">\n'
-        '    <link rel="stylesheet" href="https://unpkg.com/bpmn-js@17/dist/assets/bpmn-font/css/bpmn.css">\n'
-        '    <script src="https://unpkg.com/bpmn-js@17/dist/bpmn-navigated-viewer.production.min.js"></script>\n'
-        "    " + _bpmn_data_script
+
+def _write_provider_cards(
+    write: Writer,
+    sorted_providers: List[str],
+    categories: Dict[str, Category],
+    final_scores: Dict[str, str],
+    tco_values: Dict[str, str],
+) -> None:
+    """Write the ranked provider score cards, three per row."""
+    # Categories in _CATEGORY_LABELS order, None where the CSV has no such block
+    cats = [categories.get(cat_id) for cat_id, _label, _max in _CATEGORY_LABELS]
+
+    # 5 rows × 3 providers per row
+    for rank, provider in enumerate(sorted_providers, 1):
+        if rank % 3 == 1:
+            if rank > 1:
+                write("\n</div>\n")
+            write('<div class="fs-row fs-row-3">\n')
+        else:
+            write("\n")
+        i = _PROVIDER_IDX[provider]
+        category_scores = [
+            (cat.subtotals[i], cat.subtotal_values[i]) if cat else ("0%", 0.0)
+            for cat in cats
+        ]
+        write(
+            generate_provider_card(
+                provider,
+                rank,
+                final_scores.get(provider, "0%"),
+                tco_values.get(provider, "N/A"),
+                category_scores,
+            )
+        )
+    if sorted_providers:
+        write("\n</div>")
+
+
+def write_html(
+    out: TextIO,
+    categories: Dict[str, Category],
+    final_scores: Dict[str, str],
+    tco_values: Dict[str, str],
+    asis_bpmn_xml: str = "",
+    tobe_bpmn_xml: str = "",
+    sorted_providers: List[str] | None = None,
+) -> None:
+    """Write the complete HTML document to ``out`` fragment by fragment.
+
+    ``sorted_providers`` is the ranking from _rank_providers(); it is computed
+    here when the caller has not already done so.
+    """
+    if sorted_providers is None:
+        sorted_providers = _rank_providers(final_scores)
+
+    # Fragments go straight to the output instead of being joined in memory.
+    write = out.write
+
+    write(_HTML_HEAD_OPEN)
+    write(_CSS_MIN)
+    write("    </style>\n")
+    # bpmn-js CDN assets and BPMN data, right before </head>. The JSON-encoded
+    # diagrams are the largest dynamic strings in the page, so they are written
+    # directly rather than concatenated into one <script> string first.
+    write(_BPMN_ASSETS_HTML)
+    write("    <script>\nwindow.__bpmnData = {\n  asis: ")
+    write(json.dumps(asis_bpmn_xml))
+    write(",\n  tobe: ")
+    write(json.dumps(tobe_bpmn_xml))
+    write("\n};\n</script>\n")
+    write(_PAGE_TOP_HTML)
+    _write_provider_cards(
+        write, sorted_providers, categories, final_scores, tco_values
     )
-    _html = _html.replace("</head>", _cdn + "\n</head>", 1)
+    write(_METHODOLOGY_HTML)
+    header_cols = _render_header_cols(sorted_providers)
+    # Tabs follow CATEGORY_MAP order, whatever order the CSV lists them in
+    tab_ids = [cat_id for cat_id, _label, _max in _CATEGORY_LABELS]
+    for i, cat_id in enumerate(c for c in tab_ids if c in categories):
+        if i:
+            write("\n")
+        generate_category_tab(
+            write, cat_id, categories[cat_id], sorted_providers, header_cols
+        )
+    write("\n\n")
+    write(generate_recommendations_tab(final_scores))
+    write("\n\n")
+    write(generate_asis_tab())
+    write("\n\n")
+    write(generate_tobe_tab())
+    write(_SCRIPT_HTML)
+
+
+def generate_html(
+    categories: Dict[str, Category],
+    final_scores: Dict[str, str],
+    tco_values: Dict[str, str],
+    asis_bpmn_xml: str = "",
+    tobe_bpmn_xml: str = "",
+) -> str:
+    """Generate the complete HTML document as a string."""
+    buf = io.StringIO()
+    write_html(buf, categories, final_scores, tco_values, asis_bpmn_xml, tobe_bpmn_xml)
+    return buf.getvalue()
+
+
+def _read_if_exists(path: Path) -> bytes | None:
+    """Return the file's bytes, or None when it does not exist."""
+    return path.read_bytes() if path.exists() else None
+
+
+def _inputs_digest(blobs: List[bytes | None]) -> str:
+    """Hash the contents of the build inputs; a missing file hashes as empty."""
+    h = hashlib.blake2b(digest_size=16)
+    for data in blobs:
+        data = data or b""
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
 
-    return _html
+
+def _build_stamp(digest: str, html_path: Path) -> str:
+    """Tie an inputs digest to the exact index.html file it produced."""
+    st = html_path.stat()
+    return f"{digest} {st.st_size} {st.st_mtime_ns}"
+
+
+def _write_gzip(html_path: Path, gz_path: Path) -> None:
+    """Write a gzip-precompressed copy of the page to ``gz_path``.
+
+    Static servers that support precompressed files (nginx gzip_static,
+    Caddy precompressed, ...) can send these bytes as-is. mtime=0 keeps the
+    archive byte-identical across builds of the same page.
+    """
+    tmp_path = gz_path.with_suffix(".gz.tmp")
+    tmp_path.write_bytes(
+        gzip.compress(html_path.read_bytes(), compresslevel=9, mtime=0)
+    )
+    os.replace(tmp_path, gz_path)
 
 
 def main() -> None:
@@ -3551,46 +3499,118 @@ def main() -> None:
     csv_path = script_dir / "new_data.csv"
     html_path = script_dir / "index.html"
     backup_path = script_dir / "index_backup.html"
+    gz_path = script_dir / "index.html.gz"
+    stamp_path = script_dir / ".build_cache" / "index.stamp"
+
+    # The page is a pure function of the CSV, the BPMN files and this script.
+    # If none of them changed and index.html is the file the last run left,
+    # there is nothing to regenerate. Each input is read once: the same bytes
+    # feed the digest and, on a rebuild, the parser and the page.
+    csv_bytes = _read_if_exists(csv_path)
+    bpmn_bytes = {
+        name: _read_if_exists(script_dir / name) for name in ("asis.bpmn", "tobe.bpmn")
+    }
+    digest = _inputs_digest(
+        [csv_bytes, *bpmn_bytes.values(), Path(__file__).read_bytes()]
+    )
+    if (
+        html_path.exists()
+        and gz_path.exists()
+        and stamp_path.exists()
+        and stamp_path.read_text(encoding="utf-8") == _build_stamp(digest, html_path)
+    ):
+        print(f"Inputs unchanged since the last build: {html_path} is up to date")
+        return
+
+    def _save_stamp() -> None:
+        stamp_path.parent.mkdir(exist_ok=True)
+        stamp_path.write_text(_build_stamp(digest, html_path), encoding="utf-8")
 
     print(f"Reading CSV from: {csv_path}")
 
-    categories, final_scores, tco_values = parse_csv(str(csv_path), delimiter=";")
+    # A missing CSV is left to parse_csv, which raises FileNotFoundError
+    categories, final_scores, tco_values = parse_csv(
+        str(csv_path),
+        delimiter=";",
+        text=None if csv_bytes is None else _decode_text(csv_bytes),
+    )
 
     print(f"Parsed {len(categories)} categories:")
     for cat_id, cat in categories.items():
         print(f"  - {cat.name}: {len(cat.criteria)} criteria")
 
-    print("\nFinal scores:")
-    for provider, score in sorted(
-        final_scores.items(),
-        key=lambda x: _parse_score_float(x[1]),
-        reverse=True,
-    ):
-        print(f"  - {provider}: {score}")
+    # Ranked once; the same order is reused for the page itself
+    sorted_providers = _rank_providers(final_scores)
 
-    if html_path.exists():
-        shutil.copy(html_path, backup_path)
-        print(f"\nBackup created: {backup_path}")
+    print("\nFinal scores:")
+    for provider in sorted_providers:
+        if provider in final_scores:
+            print(f"  - {provider}: {final_scores[provider]}")
 
     def _read_bpmn(name: str) -> str:
         p = script_dir / name
-        if p.exists():
+        data = bpmn_bytes[name]
+        if data is not None:
             print(f"Loading BPMN: {p}")
-            return p.read_text(encoding="utf-8")
+            return _decode_text(data)
         print(f"BPMN file not found (skipped): {p}")
         return ""
 
     asis_bpmn = _read_bpmn("asis.bpmn")
     tobe_bpmn = _read_bpmn("tobe.bpmn")
-    html_content = generate_html(
-        categories, final_scores, tco_values, asis_bpmn, tobe_bpmn
-    )
+    tmp_path = html_path.with_suffix(".html.tmp")
+    # newline="\n" skips the platform newline translation (and keeps the
+    # output LF on every OS); the 1 MiB buffer holds the whole ~550 KB page,
+    # so the encoded fragments reach the disk in a single write() call.
+    try:
+        with open(
+            tmp_path, "w", encoding="utf-8", newline="\n", buffering=1 << 20
+        ) as f:
+            write_html(
+                f,
+                categories,
+                final_scores,
+                tco_values,
+                asis_bpmn,
+                tobe_bpmn,
+                sorted_providers,
+            )
+            # Make sure the data is on disk before the rename can publish it
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # Nothing changed since the last run: keep index.html and its backup as is.
+    if html_path.exists() and filecmp.cmp(tmp_path, html_path, shallow=False):
+        tmp_path.unlink()
+        _save_stamp()
+        print(f"\nHTML unchanged: {html_path}")
+        print(f"File size: {html_path.stat().st_size:,} bytes")
+        if not gz_path.exists():
+            _write_gzip(html_path, gz_path)
+        return
+
+    # The new page is swapped in with os.replace, so the old index.html inode
+    # is never modified and the backup can simply be a hardlink to it instead
+    # of a full copy.
+    if html_path.exists():
+        backup_path.unlink(missing_ok=True)
+        try:
+            os.link(html_path, backup_path)
+        except OSError:
+            # Filesystem without hardlink support
+            shutil.copy(html_path, backup_path)
+        print(f"\nBackup created: {backup_path}")
 
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    os.replace(tmp_path, html_path)
+    _save_stamp()
 
     print(f"\nGenerated HTML: {html_path}")
-    print(f"File size: {len(html_content):,} bytes")
+    print(f"File size: {html_path.stat().st_size:,} bytes")
+    _write_gzip(html_path, gz_path)
+    print(f"Gzipped: {gz_path} ({gz_path.stat().st_size:,} bytes)")
 
 
 if __name__ == "__main__":